@@ -3,13 +3,15 @@ from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
 from alembic import context
 
+from app.config import settings
 from app.database import Base
-from app.models import Video, Playlist, PlaylistVideo, Transcription  # noqa: F401
+from app.models import Video, Playlist, PlaylistVideo, Transcription, TranscriptSegment, PlatformCredential, Job  # noqa: F401
 
 config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+config.set_main_option("sqlalchemy.url", settings.database_url)
 target_metadata = Base.metadata
 
 
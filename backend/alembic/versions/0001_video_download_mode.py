@@ -0,0 +1,28 @@
+"""add videos.download_mode
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fresh databases already get the column from create_all at startup.
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("videos")}
+    if "download_mode" not in columns:
+        op.add_column("videos", sa.Column("download_mode", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("videos") as batch_op:
+        batch_op.drop_column("download_mode")
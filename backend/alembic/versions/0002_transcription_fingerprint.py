@@ -0,0 +1,36 @@
+"""add transcriptions.audio_fingerprint
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 10:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    columns = {c["name"] for c in inspector.get_columns("transcriptions")}
+    if "audio_fingerprint" not in columns:
+        op.add_column(
+            "transcriptions", sa.Column("audio_fingerprint", sa.String(64), nullable=True)
+        )
+    indexes = {i["name"] for i in inspector.get_indexes("transcriptions")}
+    if "ix_transcriptions_audio_fingerprint" not in indexes:
+        op.create_index(
+            "ix_transcriptions_audio_fingerprint", "transcriptions", ["audio_fingerprint"]
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transcriptions_audio_fingerprint", table_name="transcriptions")
+    with op.batch_alter_table("transcriptions") as batch_op:
+        batch_op.drop_column("audio_fingerprint")
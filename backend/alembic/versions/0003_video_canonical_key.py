@@ -0,0 +1,55 @@
+"""add videos.canonical_key with a unique index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 11:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.canonical_url import canonical_key
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {c["name"] for c in inspector.get_columns("videos")}
+    if "canonical_key" not in columns:
+        op.add_column("videos", sa.Column("canonical_key", sa.String(), nullable=True))
+
+    # Backfill oldest first; later duplicates keep a NULL key so the unique index holds.
+    seen = {
+        key for key, in bind.execute(
+            sa.text("SELECT canonical_key FROM videos WHERE canonical_key IS NOT NULL")
+        )
+    }
+    rows = bind.execute(
+        sa.text("SELECT id, url FROM videos WHERE canonical_key IS NULL ORDER BY created_at")
+    ).all()
+    for video_id, url in rows:
+        key = canonical_key(url)
+        if key in seen:
+            continue
+        seen.add(key)
+        bind.execute(
+            sa.text("UPDATE videos SET canonical_key = :key WHERE id = :id"),
+            {"key": key, "id": video_id},
+        )
+
+    indexes = {i["name"] for i in inspector.get_indexes("videos")}
+    if "ix_videos_canonical_key" not in indexes:
+        op.create_index("ix_videos_canonical_key", "videos", ["canonical_key"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_videos_canonical_key", table_name="videos")
+    with op.batch_alter_table("videos") as batch_op:
+        batch_op.drop_column("canonical_key")
@@ -0,0 +1,38 @@
+"""add video_search FTS5 index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 12:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.services.search_index import CREATE_SQL
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(CREATE_SQL)
+    op.execute("DELETE FROM video_search")
+    op.execute(
+        """
+        INSERT INTO video_search (video_id, title, description, transcript)
+        SELECT v.id, COALESCE(v.title, ''), COALESCE(v.description, ''),
+               COALESCE((
+                   SELECT t.raw_text FROM transcriptions t
+                   WHERE t.video_id = v.id
+                   ORDER BY t.created_at DESC LIMIT 1
+               ), '')
+        FROM videos v
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS video_search")
@@ -0,0 +1,34 @@
+"""add playlists.video_count
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 13:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("playlists")}
+    if "video_count" not in columns:
+        op.add_column(
+            "playlists",
+            sa.Column("video_count", sa.Integer(), nullable=False, server_default="0"),
+        )
+    op.execute(
+        "UPDATE playlists SET video_count = "
+        "(SELECT COUNT(*) FROM playlist_videos WHERE playlist_id = playlists.id)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("playlists") as batch_op:
+        batch_op.drop_column("video_count")
@@ -0,0 +1,33 @@
+"""add keyset pagination indexes for videos and transcriptions
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 14:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_videos_created_at_id": ("videos", "created_at, id"),
+    "ix_videos_status_created_at_id": ("videos", "status, created_at, id"),
+    "ix_transcriptions_created_at_id": ("transcriptions", "created_at, id"),
+    "ix_transcriptions_video_id_created_at": ("transcriptions", "video_id, created_at"),
+}
+
+
+def upgrade() -> None:
+    for name, (table, columns) in INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,52 @@
+"""add video_imports and videos.import_id
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 15:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("video_imports"):
+        op.create_table(
+            "video_imports",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("source_urls", sa.JSON(), nullable=False),
+            sa.Column("title", sa.String(), nullable=True),
+            sa.Column(
+                "playlist_id",
+                sa.String(36),
+                sa.ForeignKey("playlists.id", ondelete="SET NULL"),
+                nullable=True,
+            ),
+            sa.Column("video_ids", sa.JSON(), nullable=False),
+            sa.Column("created_count", sa.Integer(), nullable=False),
+            sa.Column("existing_count", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        )
+
+    columns = {c["name"] for c in inspector.get_columns("videos")}
+    if "import_id" not in columns:
+        # SQLite cannot add a foreign key to an existing table; the ORM model declares it.
+        op.add_column("videos", sa.Column("import_id", sa.String(36), nullable=True))
+    indexes = {i["name"] for i in inspector.get_indexes("videos")}
+    if "ix_videos_import_id" not in indexes:
+        op.create_index("ix_videos_import_id", "videos", ["import_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_videos_import_id", table_name="videos")
+    with op.batch_alter_table("videos") as batch_op:
+        batch_op.drop_column("import_id")
+    op.drop_table("video_imports")
@@ -0,0 +1,33 @@
+"""add per-credential download tuning columns
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 15:30:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ("concurrent_fragments", "http_chunk_size_mb", "retries")
+
+
+def upgrade() -> None:
+    columns = {
+        c["name"] for c in sa.inspect(op.get_bind()).get_columns("platform_credentials")
+    }
+    for name in _COLUMNS:
+        if name not in columns:
+            op.add_column("platform_credentials", sa.Column(name, sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("platform_credentials") as batch_op:
+        for name in _COLUMNS:
+            batch_op.drop_column(name)
@@ -0,0 +1,27 @@
+"""add transcriptions.real_time_factor
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 16:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("transcriptions")}
+    if "real_time_factor" not in columns:
+        op.add_column("transcriptions", sa.Column("real_time_factor", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transcriptions") as batch_op:
+        batch_op.drop_column("real_time_factor")
@@ -0,0 +1,40 @@
+"""add jobs.priority for low-priority model upgrades
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 17:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("jobs")}
+    if "priority" not in columns:
+        op.add_column(
+            "jobs",
+            sa.Column("priority", sa.Integer(), nullable=False, server_default="0"),
+        )
+    op.execute("DROP INDEX IF EXISTS ix_jobs_stage_status_created_at")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_stage_status_priority_created_at "
+        "ON jobs (stage, status, priority, created_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_jobs_stage_status_priority_created_at")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_stage_status_created_at "
+        "ON jobs (stage, status, created_at)"
+    )
+    with op.batch_alter_table("jobs") as batch_op:
+        batch_op.drop_column("priority")
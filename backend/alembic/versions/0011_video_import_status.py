@@ -0,0 +1,43 @@
+"""add video_imports.status for background expansion
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 18:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("video_imports")}
+    # Imports created before this revision were expanded in the request.
+    if "status" not in columns:
+        op.add_column(
+            "video_imports",
+            sa.Column("status", sa.String(), nullable=False, server_default="ready"),
+        )
+    if "error_message" not in columns:
+        op.add_column("video_imports", sa.Column("error_message", sa.String(), nullable=True))
+    if "create_playlist" not in columns:
+        op.add_column(
+            "video_imports",
+            sa.Column("create_playlist", sa.Boolean(), nullable=False, server_default="0"),
+        )
+    if "download_mode" not in columns:
+        op.add_column("video_imports", sa.Column("download_mode", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("video_imports") as batch_op:
+        batch_op.drop_column("download_mode")
+        batch_op.drop_column("create_playlist")
+        batch_op.drop_column("error_message")
+        batch_op.drop_column("status")
@@ -6,7 +6,62 @@ class Settings(BaseSettings):
     storage_path: str = "storage"
     whisper_engine: str = "whisper_local"
     whisper_model: str = "base"
+    model_policy: str = "fixed"  # "fixed" or "adaptive"
+    model_fast: str = "tiny"  # adaptive: long videos and jobs behind a backlog
+    model_long_seconds: int = 3600
+    model_backlog_threshold: int = 3
+    model_upgrade_idle: bool = True  # adaptive: re-transcribe fast results when idle
+    model_upgrade_interval: float = 60.0
     openai_api_key: str = ""
+    openai_base_url: str = ""  # empty uses api.openai.com
+    openai_chunk_seconds: int = 600
+    openai_audio_bitrate_kbps: int = 32
+    openai_concurrency: int = 4
+    openai_max_retries: int = 5
+    openai_timeout_seconds: float = 300.0
+    download_mode: str = "audio"  # "audio" or "video"
+    download_concurrent_fragments: int = 4
+    download_http_chunk_size_mb: int = 10  # 0 disables ranged requests
+    download_retries: int = 10
+    subtitles_policy: str = "off"  # "off", "manual" or "any" (also auto-generated)
+    subtitles_languages: str = ""  # comma-separated; empty uses the video's language
+    subtitles_min_coverage: float = 0.5
+    whisper_preload: bool = True
+    whisper_model_cache_mb: int = 4096
+    audio_streaming: bool = False
+    stream_window_seconds: int = 300
+    transcription_cache: bool = True
+    transcription_cache_max_entries: int = 10000
+    transcription_cache_ttl_days: int = 0
+    transcribe_chunked: bool = False
+    chunked_min_seconds: int = 1200
+    chunk_seconds: int = 300
+    chunk_processes: int = 0
+    vad_enabled: bool = False
+    vad_energy_margin_db: float = 12.0  # above the estimated noise floor
+    vad_min_silence_seconds: float = 1.0
+    vad_padding_seconds: float = 0.3
+    faster_whisper_compute_type: str = "int8"
+    faster_whisper_cpu_threads: int = 0  # 0 uses the worker's share of the cores
+    faster_whisper_beam_size: int = 5
+    whisper_processes: int = 0  # 0 sizes the pool from transcribe/chunk settings
+    whisper_worker_max_tasks: int = 50
+    whisper_worker_max_rss_mb: int = 6144
+    sqlite_busy_timeout: float = 30.0
+    sqlite_cache_size_kb: int = 65536
+    sqlite_mmap_size_mb: int = 256
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_write_batch_ms: int = 50
+    download_workers: int = 2
+    extract_workers: int = 1
+    transcribe_workers: int = 1
+    queue_poll_interval: float = 5.0
+    import_max_items: int = 1000
+    import_concurrency: int = 1
+    events_progress_interval: float = 0.5
+    events_heartbeat_seconds: float = 15.0
+    events_queue_size: int = 256
 
     model_config = {"env_file": ".env"}
 
@@ -1,13 +1,43 @@
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import AsyncAdaptedQueuePool, create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.config import settings
 
 engine = create_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False},
+    connect_args={"check_same_thread": False, "timeout": settings.sqlite_busy_timeout},
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+)
+# Async engine for the request path, so API handlers don't occupy threadpool
+# slots while they wait on the database.
+async_engine = create_async_engine(
+    settings.database_url.replace("sqlite://", "sqlite+aiosqlite://", 1),
+    connect_args={"timeout": settings.sqlite_busy_timeout},
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
 )
+
+
+@event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets API reads proceed while a pipeline write is in flight.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout * 1000)}")
+    cursor.execute(f"PRAGMA cache_size=-{settings.sqlite_cache_size_kb}")
+    cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size_mb * 1024 * 1024}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 
@@ -17,3 +47,20 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def run_migrations():
+    from alembic import command
+    from alembic.config import Config
+
+    # No ini file here: alembic's fileConfig would reset the server's loggers.
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    config = Config()
+    config.set_main_option("script_location", os.path.join(backend_dir, "alembic"))
+    config.set_main_option("sqlalchemy.url", settings.database_url)
+    command.upgrade(config, "head")
@@ -1,15 +1,25 @@
 import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import func
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import Base, engine, get_db
-from app.models import Video, Playlist, Transcription, PlatformCredential  # noqa: F401
+from app.database import Base, async_engine, engine, get_async_db, run_migrations
+from app.models import (  # noqa: F401
+    Video, Playlist, Transcription, PlatformCredential, Job, VideoImport,
+)
 from app.routers import videos, playlists, transcriptions, settings
-from app.routers import credentials
+from app.routers import credentials, events, imports, queue
 from app.config import settings as app_settings
+from app.services import model_policy
+from app.services.transcriber import LOCAL_ENGINES
+from app.services.whisper_pool import whisper_pool
+from app.services.stats import get_stats
+from app.tasks import import_worker
+from app.tasks.queue import start_workers, stop_workers
+from app.tasks.video_writer import video_writer
 
 
 @asynccontextmanager
@@ -18,7 +28,19 @@ async def lifespan(app: FastAPI):
     os.makedirs(os.path.join(app_settings.storage_path, "videos"), exist_ok=True)
     os.makedirs(os.path.join(app_settings.storage_path, "cookies"), exist_ok=True)
     Base.metadata.create_all(bind=engine)
+    run_migrations()
+    if app_settings.whisper_preload and app_settings.whisper_engine in LOCAL_ENGINES:
+        whisper_pool.preload(app_settings.whisper_model, app_settings.whisper_engine)
+        if model_policy.adaptive():
+            whisper_pool.preload(app_settings.model_fast, app_settings.whisper_engine)
+    start_workers()
+    import_worker.start()
     yield
+    import_worker.stop()
+    stop_workers()
+    video_writer.close()
+    whisper_pool.close()
+    await async_engine.dispose()
 
 
 app = FastAPI(title="Video Study System", lifespan=lifespan)
@@ -29,6 +51,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 app.include_router(videos.router, prefix="/api/v1")
@@ -36,47 +59,20 @@ app.include_router(playlists.router, prefix="/api/v1")
 app.include_router(transcriptions.router, prefix="/api/v1")
 app.include_router(settings.router, prefix="/api/v1")
 app.include_router(credentials.router, prefix="/api/v1")
+app.include_router(queue.router, prefix="/api/v1")
+app.include_router(events.router, prefix="/api/v1")
+app.include_router(imports.router, prefix="/api/v1")
 
 
 @app.get("/api/v1/health")
-def health():
+async def health():
     return {"status": "ok"}
 
 
 @app.get("/api/v1/stats")
-def stats():
-    from app.database import SessionLocal
-
-    db = SessionLocal()
-    try:
-        total_videos = db.query(Video).count()
-        completed = db.query(Video).filter(Video.status == "completed").count()
-        processing = (
-            db.query(Video)
-            .filter(Video.status.notin_(["completed", "failed", "pending"]))
-            .count()
-        )
-        failed = db.query(Video).filter(Video.status == "failed").count()
-        total_playlists = db.query(Playlist).count()
-        total_transcriptions = db.query(Transcription).count()
-
-        recent_videos = (
-            db.query(Video)
-            .order_by(Video.created_at.desc())
-            .limit(5)
-            .all()
-        )
-
-        from app.schemas.video import VideoResponse
-
-        return {
-            "total_videos": total_videos,
-            "completed": completed,
-            "processing": processing,
-            "failed": failed,
-            "total_playlists": total_playlists,
-            "total_transcriptions": total_transcriptions,
-            "recent_videos": [VideoResponse.model_validate(v) for v in recent_videos],
-        }
-    finally:
-        db.close()
+async def stats(request: Request, db: AsyncSession = Depends(get_async_db)):
+    etag, payload = await get_stats(db)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(payload, headers=headers)
@@ -1,6 +1,17 @@
 from app.models.video import Video
 from app.models.playlist import Playlist, PlaylistVideo
-from app.models.transcription import Transcription
+from app.models.transcription import Transcription, TranscriptSegment
 from app.models.platform_credential import PlatformCredential
+from app.models.job import Job
+from app.models.video_import import VideoImport
 
-__all__ = ["Video", "Playlist", "PlaylistVideo", "Transcription", "PlatformCredential"]
+__all__ = [
+    "Video",
+    "Playlist",
+    "PlaylistVideo",
+    "Transcription",
+    "TranscriptSegment",
+    "PlatformCredential",
+    "Job",
+    "VideoImport",
+]
@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index(
+            "ix_jobs_stage_status_priority_created_at",
+            "stage",
+            "status",
+            "priority",
+            "created_at",
+        ),
+    )
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    video_id = Column(
+        String(36), ForeignKey("videos.id", ondelete="CASCADE"), nullable=False
+    )
+    stage = Column(String, nullable=False, default="download")  # download, extract, transcribe
+    status = Column(String, nullable=False, default="queued")  # queued, running, done, failed
+    engine = Column(String, nullable=True)
+    model_name = Column(String, nullable=True)
+    priority = Column(Integer, nullable=False, default=0, server_default="0")  # higher runs first
+    attempts = Column(Integer, nullable=False, default=0)
+    error_message = Column(String, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    video = relationship("Video", back_populates="jobs")
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, Integer, DateTime
 
 from app.database import Base
 
@@ -16,6 +16,10 @@ class PlatformCredential(Base):
     username = Column(String, nullable=True)
     password = Column(String, nullable=True)
     cookies_path = Column(String, nullable=True)
+    # Download tuning for this platform; None falls back to the global settings.
+    concurrent_fragments = Column(Integer, nullable=True)
+    http_chunk_size_mb = Column(Integer, nullable=True)
+    retries = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
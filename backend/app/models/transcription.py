@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -9,6 +9,10 @@ from app.database import Base
 
 class Transcription(Base):
     __tablename__ = "transcriptions"
+    __table_args__ = (
+        Index("ix_transcriptions_created_at_id", "created_at", "id"),
+        Index("ix_transcriptions_video_id_created_at", "video_id", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     video_id = Column(
@@ -19,7 +23,32 @@ class Transcription(Base):
     language = Column(String, nullable=True)
     raw_text = Column(String, nullable=True)
     markdown_path = Column(String, nullable=True)
+    audio_fingerprint = Column(String(64), nullable=True, index=True)
     duration_seconds = Column(Integer, nullable=True)
+    real_time_factor = Column(Float, nullable=True)  # processing time / audio length
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     video = relationship("Video", back_populates="transcriptions")
+    segments = relationship(
+        "TranscriptSegment",
+        back_populates="transcription",
+        cascade="all, delete-orphan",
+        order_by="TranscriptSegment.position",
+    )
+
+
+class TranscriptSegment(Base):
+    __tablename__ = "transcript_segments"
+    __table_args__ = (
+        Index("ix_transcript_segments_transcription_start", "transcription_id", "start_seconds"),
+    )
+
+    transcription_id = Column(
+        String(36), ForeignKey("transcriptions.id", ondelete="CASCADE"), primary_key=True
+    )
+    position = Column(Integer, primary_key=True)
+    start_seconds = Column(Float, nullable=False)
+    end_seconds = Column(Float, nullable=False)
+    text = Column(String, nullable=False)
+
+    transcription = relationship("Transcription", back_populates="segments")
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -9,19 +9,28 @@ from app.database import Base
 
 class Video(Base):
     __tablename__ = "videos"
+    __table_args__ = (
+        Index("ix_videos_created_at_id", "created_at", "id"),
+        Index("ix_videos_status_created_at_id", "status", "created_at", "id"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     url = Column(String, nullable=False)
+    canonical_key = Column(String, nullable=True, unique=True, index=True)
     title = Column(String, nullable=True)
     description = Column(String, nullable=True)
     duration_seconds = Column(Integer, nullable=True)
     thumbnail_url = Column(String, nullable=True)
     channel_name = Column(String, nullable=True)
+    download_mode = Column(String, nullable=True)  # "audio" or "video"; None uses settings
     status = Column(String, nullable=False, default="pending")
     error_message = Column(String, nullable=True)
     video_path = Column(String, nullable=True)
     audio_path = Column(String, nullable=True)
     transcription_path = Column(String, nullable=True)
+    import_id = Column(
+        String(36), ForeignKey("video_imports.id", ondelete="SET NULL"), nullable=True, index=True
+    )
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
@@ -35,3 +44,4 @@ class Video(Base):
     playlist_associations = relationship(
         "PlaylistVideo", back_populates="video", cascade="all, delete-orphan"
     )
+    jobs = relationship("Job", back_populates="video", cascade="all, delete-orphan")
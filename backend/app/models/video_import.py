@@ -0,0 +1,25 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, Boolean, Column, String, Integer, DateTime, ForeignKey
+
+from app.database import Base
+
+
+class VideoImport(Base):
+    __tablename__ = "video_imports"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    status = Column(String, nullable=False, default="pending")  # pending, expanding, ready, failed
+    error_message = Column(String, nullable=True)
+    source_urls = Column(JSON, nullable=False, default=list)
+    create_playlist = Column(Boolean, nullable=False, default=False)
+    download_mode = Column(String, nullable=True)
+    title = Column(String, nullable=True)
+    playlist_id = Column(
+        String(36), ForeignKey("playlists.id", ondelete="SET NULL"), nullable=True
+    )
+    video_ids = Column(JSON, nullable=False, default=list)  # every item, in source order
+    created_count = Column(Integer, nullable=False, default=0)
+    existing_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from fastapi import HTTPException, Response
+from sqlalchemy import DateTime, Select, String, literal, tuple_
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    return f"{created_at.isoformat()},{row_id}"
+
+
+def decode_cursor(after: str) -> tuple[datetime, str]:
+    try:
+        created_at, row_id = after.split(",", 1)
+        return datetime.fromisoformat(created_at), row_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_select(
+    stmt: Select, model, after: str | None, limit: int, offset: int = 0
+) -> Select:
+    """Newest-first page of ``model`` rows strictly after the ``after`` cursor.
+
+    Seeks on (created_at, id) so deep pages cost the same as the first one.
+    """
+    if after:
+        created_at, row_id = decode_cursor(after)
+        stmt = stmt.where(
+            tuple_(model.created_at, model.id)
+            < tuple_(literal(created_at, DateTime), literal(row_id, String))
+        )
+    return (
+        stmt.order_by(model.created_at.desc(), model.id.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+def set_next_cursor(response: Response, rows: list, limit: int):
+    if len(rows) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].created_at, rows[-1].id)
@@ -1,10 +1,13 @@
 import os
 import shutil
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.config import settings
 from app.models.platform_credential import PlatformCredential
 from app.schemas.platform_credential import (
@@ -15,6 +18,8 @@ from app.schemas.platform_credential import (
 
 router = APIRouter(prefix="/credentials", tags=["credentials"])
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 @router.post("/", response_model=PlatformCredentialResponse)
 def create_credential(data: PlatformCredentialCreate, db: Session = Depends(get_db)):
@@ -24,6 +29,9 @@ def create_credential(data: PlatformCredentialCreate, db: Session = Depends(get_
         auth_type=data.auth_type,
         username=data.username,
         password=data.password,
+        concurrent_fragments=data.concurrent_fragments,
+        http_chunk_size_mb=data.http_chunk_size_mb,
+        retries=data.retries,
     )
     db.add(credential)
     db.commit()
@@ -32,8 +40,10 @@ def create_credential(data: PlatformCredentialCreate, db: Session = Depends(get_
 
 
 @router.get("/", response_model=list[PlatformCredentialResponse])
-def list_credentials(db: Session = Depends(get_db)):
-    credentials = db.query(PlatformCredential).order_by(PlatformCredential.created_at.desc()).all()
+async def list_credentials(db: AsyncSession = Depends(get_async_db)):
+    credentials = await db.scalars(
+        select(PlatformCredential).order_by(PlatformCredential.created_at.desc())
+    )
     return [PlatformCredentialResponse.from_model(c) for c in credentials]
 
 
@@ -67,20 +77,21 @@ def delete_credential(credential_id: str, db: Session = Depends(get_db)):
 
 
 @router.post("/{credential_id}/cookies", response_model=PlatformCredentialResponse)
-def upload_cookies(credential_id: str, file: UploadFile = File(...), db: Session = Depends(get_db)):
-    credential = db.query(PlatformCredential).filter(PlatformCredential.id == credential_id).first()
+async def upload_cookies(
+    credential_id: str, file: UploadFile = File(...), db: AsyncSession = Depends(get_async_db)
+):
+    credential = await db.get(PlatformCredential, credential_id)
     if not credential:
         raise HTTPException(status_code=404, detail="Credencial não encontrada")
 
-    cookies_dir = os.path.join(settings.storage_path, "cookies", credential_id)
-    os.makedirs(cookies_dir, exist_ok=True)
+    cookies_dir = anyio.Path(settings.storage_path, "cookies", credential_id)
+    await cookies_dir.mkdir(parents=True, exist_ok=True)
 
-    cookies_file = os.path.join(cookies_dir, "cookies.txt")
-    with open(cookies_file, "wb") as f:
-        content = file.file.read()
-        f.write(content)
+    async with await anyio.open_file(cookies_dir / "cookies.txt", "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
 
     credential.cookies_path = os.path.join("cookies", credential_id, "cookies.txt")
-    db.commit()
-    db.refresh(credential)
+    await db.commit()
+    await db.refresh(credential)
     return PlatformCredentialResponse.from_model(credential)
@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal, get_async_db
+from app.models.video import Video
+from app.services.events import Event, event_bus
+
+router = APIRouter(tags=["events"])
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _format(event: Event) -> str:
+    payload = {"video_id": event.video_id, **event.data}
+    return f"id: {event.id}\nevent: {event.type}\ndata: {json.dumps(payload)}\n\n"
+
+
+async def _stream(request: Request, video_id: str | None):
+    async with event_bus.subscribe(video_id) as queue:
+        if video_id:
+            # Start with the current status so clients need no separate fetch.
+            # Read after subscribing so no transition can slip in between.
+            async with AsyncSessionLocal() as db:
+                status = await db.scalar(select(Video.status).where(Video.id == video_id))
+            yield _format(Event(0, "status", video_id, {"status": status}))
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=settings.events_heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from closing an idle stream.
+                yield ": keepalive\n\n"
+                continue
+            yield _format(event)
+
+
+@router.get("/videos/{video_id}/events")
+async def video_events(
+    video_id: str, request: Request, db: AsyncSession = Depends(get_async_db)
+):
+    if not await db.get(Video, video_id):
+        raise HTTPException(status_code=404, detail="Video not found")
+
+    return StreamingResponse(
+        _stream(request, video_id),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.get("/events")
+async def all_events(request: Request):
+    return StreamingResponse(
+        _stream(request, None),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import get_async_db, get_db
+from app.models.playlist import Playlist
+from app.models.video_import import VideoImport
+from app.schemas.video_import import VideoImportCreate, VideoImportResponse
+from app.services.importer import create_import, import_progress
+from app.tasks import import_worker
+
+router = APIRouter(prefix="/imports", tags=["imports"])
+
+
+# Expanding a channel can take many yt-dlp requests, so the import is only
+# recorded here and expanded by the import worker; poll GET /imports/{id}.
+@router.post("", response_model=VideoImportResponse, status_code=202)
+def start_import(data: VideoImportCreate, db: Session = Depends(get_db)):
+    if data.playlist_id and not db.get(Playlist, data.playlist_id):
+        raise HTTPException(status_code=404, detail="Playlist not found")
+
+    video_import = create_import(
+        db,
+        data.all_urls(),
+        playlist_id=data.playlist_id,
+        create_playlist=data.create_playlist,
+        download_mode=data.download_mode,
+    )
+    db.commit()
+    import_worker.wake()
+
+    return import_progress(db, video_import)
+
+
+@router.get("", response_model=list[VideoImportResponse])
+async def list_imports(
+    limit: int = Query(20, ge=1, le=100), db: AsyncSession = Depends(get_async_db)
+):
+    imports = await db.scalars(
+        select(VideoImport).order_by(VideoImport.created_at.desc()).limit(limit)
+    )
+    return [await db.run_sync(import_progress, i) for i in imports.all()]
+
+
+@router.get("/{import_id}", response_model=VideoImportResponse)
+async def get_import(import_id: str, db: AsyncSession = Depends(get_async_db)):
+    video_import = await db.get(VideoImport, import_id)
+    if not video_import:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return await db.run_sync(import_progress, video_import)
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models.playlist import Playlist, PlaylistVideo
 from app.models.video import Video
 from app.schemas.playlist import (
@@ -13,6 +15,7 @@ from app.schemas.playlist import (
     PlaylistDetailResponse,
 )
 from app.schemas.video import VideoResponse
+from app.services import playlists as playlist_service
 
 router = APIRouter(prefix="/playlists", tags=["playlists"])
 
@@ -23,63 +26,33 @@ def create_playlist(data: PlaylistCreate, db: Session = Depends(get_db)):
     db.add(playlist)
     db.commit()
     db.refresh(playlist)
-    return PlaylistResponse(
-        id=playlist.id,
-        name=playlist.name,
-        description=playlist.description,
-        video_count=0,
-        created_at=playlist.created_at,
-        updated_at=playlist.updated_at,
-    )
+    return playlist
 
 
 @router.get("", response_model=list[PlaylistResponse])
-def list_playlists(db: Session = Depends(get_db)):
-    playlists = db.query(Playlist).order_by(Playlist.created_at.desc()).all()
-    result = []
-    for p in playlists:
-        count = (
-            db.query(PlaylistVideo)
-            .filter(PlaylistVideo.playlist_id == p.id)
-            .count()
-        )
-        result.append(
-            PlaylistResponse(
-                id=p.id,
-                name=p.name,
-                description=p.description,
-                video_count=count,
-                created_at=p.created_at,
-                updated_at=p.updated_at,
-            )
-        )
-    return result
+async def list_playlists(db: AsyncSession = Depends(get_async_db)):
+    playlists = await db.scalars(select(Playlist).order_by(Playlist.created_at.desc()))
+    return playlists.all()
 
 
 @router.get("/{playlist_id}", response_model=PlaylistDetailResponse)
-def get_playlist(playlist_id: str, db: Session = Depends(get_db)):
-    playlist = db.query(Playlist).filter(Playlist.id == playlist_id).first()
+async def get_playlist(playlist_id: str, db: AsyncSession = Depends(get_async_db)):
+    playlist = await db.get(Playlist, playlist_id)
     if not playlist:
         raise HTTPException(status_code=404, detail="Playlist not found")
 
-    pvs = (
-        db.query(PlaylistVideo)
-        .filter(PlaylistVideo.playlist_id == playlist_id)
+    videos = await db.scalars(
+        select(Video)
+        .join(PlaylistVideo, PlaylistVideo.video_id == Video.id)
+        .where(PlaylistVideo.playlist_id == playlist_id)
         .order_by(PlaylistVideo.position)
-        .all()
     )
 
-    videos = []
-    for pv in pvs:
-        video = db.query(Video).filter(Video.id == pv.video_id).first()
-        if video:
-            videos.append(video)
-
     return PlaylistDetailResponse(
         id=playlist.id,
         name=playlist.name,
         description=playlist.description,
-        video_count=len(videos),
+        video_count=playlist.video_count,
         created_at=playlist.created_at,
         updated_at=playlist.updated_at,
         videos=[VideoResponse.model_validate(v) for v in videos],
@@ -101,21 +74,7 @@ def update_playlist(
 
     db.commit()
     db.refresh(playlist)
-
-    count = (
-        db.query(PlaylistVideo)
-        .filter(PlaylistVideo.playlist_id == playlist_id)
-        .count()
-    )
-
-    return PlaylistResponse(
-        id=playlist.id,
-        name=playlist.name,
-        description=playlist.description,
-        video_count=count,
-        created_at=playlist.created_at,
-        updated_at=playlist.updated_at,
-    )
+    return playlist
 
 
 @router.delete("/{playlist_id}", status_code=204)
@@ -139,29 +98,8 @@ def add_video_to_playlist(
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    existing = (
-        db.query(PlaylistVideo)
-        .filter(
-            PlaylistVideo.playlist_id == playlist_id,
-            PlaylistVideo.video_id == data.video_id,
-        )
-        .first()
-    )
-    if existing:
+    if not playlist_service.add_videos(db, playlist_id, [data.video_id]):
         raise HTTPException(status_code=409, detail="Video already in playlist")
-
-    count = (
-        db.query(PlaylistVideo)
-        .filter(PlaylistVideo.playlist_id == playlist_id)
-        .count()
-    )
-
-    pv = PlaylistVideo(
-        playlist_id=playlist_id,
-        video_id=data.video_id,
-        position=count,
-    )
-    db.add(pv)
     db.commit()
 
     return {"status": "added"}
@@ -181,7 +119,7 @@ def remove_video_from_playlist(
     )
     if not pv:
         raise HTTPException(status_code=404, detail="Video not in playlist")
-    db.delete(pv)
+    playlist_service.remove_video(db, pv)
     db.commit()
 
 
@@ -193,17 +131,6 @@ def reorder_playlist_videos(
     if not playlist:
         raise HTTPException(status_code=404, detail="Playlist not found")
 
-    for i, video_id in enumerate(data.video_ids):
-        pv = (
-            db.query(PlaylistVideo)
-            .filter(
-                PlaylistVideo.playlist_id == playlist_id,
-                PlaylistVideo.video_id == video_id,
-            )
-            .first()
-        )
-        if pv:
-            pv.position = i
-
+    playlist_service.reorder(db, playlist_id, data.video_ids)
     db.commit()
     return {"status": "reordered"}
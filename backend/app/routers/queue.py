@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.tasks.queue import queue_stats
+
+router = APIRouter(tags=["queue"])
+
+
+@router.get("/queue")
+async def get_queue(db: AsyncSession = Depends(get_async_db)):
+    return await db.run_sync(queue_stats)
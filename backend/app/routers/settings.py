@@ -1,7 +1,12 @@
+from typing import Literal
+
 from fastapi import APIRouter
 from pydantic import BaseModel
 
 from app.config import settings
+from app.services import model_policy
+from app.services.transcriber import LOCAL_ENGINES
+from app.services.whisper_pool import whisper_pool
 
 router = APIRouter(tags=["settings"])
 
@@ -10,34 +15,71 @@ class SettingsResponse(BaseModel):
     whisper_engine: str
     whisper_model: str
     openai_api_key_set: bool
+    subtitles_policy: str
+    model_policy: str
+    model_fast: str
+    loaded_models: list[dict] = []
 
 
 class SettingsUpdate(BaseModel):
-    whisper_engine: str | None = None
+    whisper_engine: Literal["whisper_local", "faster_whisper", "openai_api"] | None = None
     whisper_model: str | None = None
     openai_api_key: str | None = None
+    subtitles_policy: Literal["off", "manual", "any"] | None = None
+    model_policy: Literal["fixed", "adaptive"] | None = None
+    model_fast: str | None = None
+
+
+def _warm_models() -> set[tuple[str, str]]:
+    """``(engine, model)`` pairs the whisper pool should keep loaded."""
+    engine = settings.whisper_engine
+    if engine not in LOCAL_ENGINES:
+        return set()
+    models = {(engine, settings.whisper_model)}
+    if model_policy.adaptive():
+        models.add((engine, settings.model_fast))
+    return models
 
 
 @router.get("/settings", response_model=SettingsResponse)
-def get_settings():
+async def get_settings():
     return SettingsResponse(
         whisper_engine=settings.whisper_engine,
         whisper_model=settings.whisper_model,
         openai_api_key_set=bool(settings.openai_api_key),
+        subtitles_policy=settings.subtitles_policy,
+        model_policy=settings.model_policy,
+        model_fast=settings.model_fast,
+        loaded_models=whisper_pool.loaded(),
     )
 
 
 @router.put("/settings", response_model=SettingsResponse)
 def update_settings(data: SettingsUpdate):
+    previous = _warm_models()
     if data.whisper_engine is not None:
         settings.whisper_engine = data.whisper_engine
     if data.whisper_model is not None:
         settings.whisper_model = data.whisper_model
     if data.openai_api_key is not None:
         settings.openai_api_key = data.openai_api_key
+    if data.subtitles_policy is not None:
+        settings.subtitles_policy = data.subtitles_policy
+    if data.model_policy is not None:
+        settings.model_policy = data.model_policy
+    if data.model_fast is not None:
+        settings.model_fast = data.model_fast
+
+    # Warm newly selected models in the background so the next job doesn't pay for them.
+    for engine, model_name in _warm_models() - previous:
+        whisper_pool.preload(model_name, engine)
 
     return SettingsResponse(
         whisper_engine=settings.whisper_engine,
         whisper_model=settings.whisper_model,
         openai_api_key_set=bool(settings.openai_api_key),
+        subtitles_policy=settings.subtitles_policy,
+        model_policy=settings.model_policy,
+        model_fast=settings.model_fast,
+        loaded_models=whisper_pool.loaded(),
     )
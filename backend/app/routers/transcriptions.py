@@ -1,18 +1,29 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.transcription import Transcription
+from app.pagination import keyset_select, set_next_cursor
 from app.schemas.transcription import TranscriptionResponse
+from app.services.transcription_cache import cache_stats
 
 router = APIRouter(prefix="/transcriptions", tags=["transcriptions"])
 
 
 @router.get("", response_model=list[TranscriptionResponse])
-def list_transcriptions(db: Session = Depends(get_db)):
-    return (
-        db.query(Transcription)
-        .order_by(Transcription.created_at.desc())
-        .limit(50)
-        .all()
-    )
+async def list_transcriptions(
+    response: Response,
+    after: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+):
+    stmt = keyset_select(select(Transcription), Transcription, after, limit)
+    transcriptions = (await db.scalars(stmt)).all()
+    set_next_cursor(response, transcriptions, limit)
+    return transcriptions
+
+
+@router.get("/cache")
+async def get_cache_stats(db: AsyncSession = Depends(get_async_db)):
+    return await db.run_sync(cache_stats)
@@ -1,68 +1,115 @@
 import os
 import shutil
-import threading
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_async_db, get_db
+from app.pagination import keyset_select, set_next_cursor
 from app.models.video import Video
-from app.models.playlist import PlaylistVideo
-from app.schemas.video import VideoCreate, VideoResponse, VideoTranscribe
-from app.schemas.transcription import TranscriptionResponse
-from app.tasks.pipeline import process_video
+from app.models.transcription import Transcription, TranscriptSegment
+from app.schemas.video import VideoCreate, VideoResponse, VideoSearchResult, VideoTranscribe
+from app.schemas.transcription import TranscriptionResponse, TranscriptSegmentPage
+from app.services.canonical_url import canonical_key
+from app.services import playlists as playlist_service
+from app.services import search_index
+from app.tasks.queue import enqueue, is_running, notify
 from app.config import settings
 
 router = APIRouter(prefix="/videos", tags=["videos"])
 
 
 @router.post("", response_model=VideoResponse, status_code=201)
-def create_video(data: VideoCreate, db: Session = Depends(get_db)):
-    video = Video(url=data.url)
-    db.add(video)
+def create_video(data: VideoCreate, response: Response, db: Session = Depends(get_db)):
+    key = canonical_key(data.url)
+    video = db.query(Video).filter(Video.canonical_key == key).first()
+    if video is None:
+        video = Video(url=data.url, canonical_key=key, download_mode=data.download_mode)
+        db.add(video)
+        try:
+            db.flush()
+        except IntegrityError:
+            # Another request inserted the same media between our lookup and flush.
+            db.rollback()
+            video = db.query(Video).filter(Video.canonical_key == key).one()
+            response.status_code = 200
+        else:
+            enqueue(db, video.id, commit=False)
+    else:
+        # Already known: link it instead of downloading and transcribing it again.
+        response.status_code = 200
 
     if data.playlist_id:
-        count = (
-            db.query(PlaylistVideo)
-            .filter(PlaylistVideo.playlist_id == data.playlist_id)
-            .count()
-        )
-        pv = PlaylistVideo(
-            playlist_id=data.playlist_id,
-            video_id=video.id,
-            position=count,
-        )
-        db.add(pv)
+        playlist_service.add_videos(db, data.playlist_id, [video.id])
 
     db.commit()
     db.refresh(video)
-
-    threading.Thread(target=process_video, args=(video.id,), daemon=True).start()
+    notify()
 
     return video
 
 
 @router.get("", response_model=list[VideoResponse])
-def list_videos(
+async def list_videos(
+    response: Response,
     status: str | None = None,
     search: str | None = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    after: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    q = db.query(Video)
+    stmt = select(Video)
     if status:
-        q = q.filter(Video.status == status)
+        stmt = stmt.where(Video.status == status)
     if search:
-        q = q.filter(Video.title.ilike(f"%{search}%"))
-    q = q.order_by(Video.created_at.desc())
-    videos = q.offset((page - 1) * per_page).limit(per_page).all()
+        if search_index.match_expression(search):
+            stmt = stmt.where(Video.id.in_(search_index.matching_ids(search)))
+        else:
+            # Nothing left to hand FTS (only quotes or spaces); match the title literally.
+            stmt = stmt.where(Video.title.ilike(f"%{search}%"))
+    # Offset paging is kept for existing clients; the after cursor takes precedence.
+    offset = 0 if after else (page - 1) * per_page
+    videos = (
+        await db.scalars(keyset_select(stmt, Video, after, per_page, offset))
+    ).all()
+    set_next_cursor(response, videos, per_page)
     return videos
 
 
+@router.get("/search", response_model=list[VideoSearchResult])
+async def search_videos(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+):
+    hits = await db.run_sync(search_index.search, q, limit)
+    videos = {
+        v.id: v
+        for v in await db.scalars(
+            select(Video).where(Video.id.in_([video_id for video_id, _, _ in hits]))
+        )
+    }
+    starts = await db.run_sync(search_index.locate, list(videos), q)
+    return [
+        VideoSearchResult(
+            video=VideoResponse.model_validate(videos[video_id]),
+            snippet=snippet,
+            rank=rank,
+            start_seconds=starts.get(video_id),
+        )
+        for video_id, snippet, rank in hits
+        if video_id in videos
+    ]
+
+
 @router.get("/{video_id}", response_model=VideoResponse)
-def get_video(video_id: str, db: Session = Depends(get_db)):
-    video = db.query(Video).filter(Video.id == video_id).first()
+async def get_video(video_id: str, db: AsyncSession = Depends(get_async_db)):
+    video = await db.get(Video, video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
     return video
@@ -78,6 +125,8 @@ def delete_video(video_id: str, db: Session = Depends(get_db)):
     if os.path.exists(video_dir):
         shutil.rmtree(video_dir)
 
+    search_index.remove_video(db, video_id)
+    playlist_service.detach_video(db, video_id)
     db.delete(video)
     db.commit()
 
@@ -89,16 +138,18 @@ def retry_video(video_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Video not found")
     if video.status != "failed":
         raise HTTPException(status_code=400, detail="Video is not in failed state")
+    if is_running(db, video.id):
+        raise HTTPException(status_code=409, detail="Video is already being processed")
 
     if video.video_path:
         video.status = "downloaded"
     else:
         video.status = "pending"
     video.error_message = None
+    enqueue(db, video.id, commit=False)
     db.commit()
     db.refresh(video)
-
-    threading.Thread(target=process_video, args=(video.id,), daemon=True).start()
+    notify()
 
     return video
 
@@ -108,53 +159,95 @@ def transcribe_video(video_id: str, data: VideoTranscribe, db: Session = Depends
     video = db.query(Video).filter(Video.id == video_id).first()
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
-    if not video.audio_path:
-        raise HTTPException(status_code=400, detail="Audio not extracted yet")
+    if is_running(db, video.id):
+        raise HTTPException(status_code=409, detail="Video is already being processed")
+
+    engine = data.engine
+    if video.audio_path:
+        video.status = "extracted"
+    elif video.video_path:
+        # Without a WAV the extract stage decides whether one is needed for this engine.
+        video.status = "downloaded"
+    elif video.status == "completed":
+        # Transcribed from platform subtitles: fetch the media this time. The
+        # engine is pinned so the download stage does not take the captions again.
+        video.status = "pending"
+        engine = engine or settings.whisper_engine
+    else:
+        raise HTTPException(status_code=400, detail="Media not downloaded yet")
 
-    video.status = "extracted"
+    enqueue(db, video.id, engine, data.model_name, commit=False)
     db.commit()
     db.refresh(video)
-
-    threading.Thread(
-        target=process_video,
-        args=(video.id, data.engine, data.model_name),
-        daemon=True,
-    ).start()
+    notify()
 
     return video
 
 
 @router.get("/{video_id}/transcription")
-def get_transcription(video_id: str, db: Session = Depends(get_db)):
-    video = db.query(Video).filter(Video.id == video_id).first()
+async def get_transcription(video_id: str, db: AsyncSession = Depends(get_async_db)):
+    video = await db.get(Video, video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
     if not video.transcription_path:
         raise HTTPException(status_code=404, detail="No transcription available")
 
-    md_full_path = os.path.join(settings.storage_path, video.transcription_path)
-    if not os.path.exists(md_full_path):
+    md_full_path = anyio.Path(settings.storage_path, video.transcription_path)
+    if not await md_full_path.exists():
         raise HTTPException(status_code=404, detail="Transcription file not found")
 
-    with open(md_full_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = await md_full_path.read_text(encoding="utf-8")
 
     return {"markdown": content}
 
 
-@router.get("/{video_id}/transcriptions", response_model=list[TranscriptionResponse])
-def list_transcriptions(video_id: str, db: Session = Depends(get_db)):
-    from app.models.transcription import Transcription
+@router.get("/{video_id}/transcription/segments", response_model=TranscriptSegmentPage)
+async def get_transcription_segments(
+    video_id: str,
+    transcription_id: str | None = None,
+    start: float | None = Query(None, ge=0),
+    end: float | None = Query(None, ge=0),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(200, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db),
+):
+    stmt = select(Transcription).where(Transcription.video_id == video_id)
+    if transcription_id:
+        stmt = stmt.where(Transcription.id == transcription_id)
+    transcription = await db.scalar(stmt.order_by(Transcription.created_at.desc()).limit(1))
+    if not transcription:
+        raise HTTPException(status_code=404, detail="No transcription available")
 
-    video = db.query(Video).filter(Video.id == video_id).first()
+    stmt = select(TranscriptSegment).where(
+        TranscriptSegment.transcription_id == transcription.id
+    )
+    if start is not None:
+        stmt = stmt.where(TranscriptSegment.end_seconds > start)
+    if end is not None:
+        stmt = stmt.where(TranscriptSegment.start_seconds < end)
+    segments = (
+        await db.scalars(
+            stmt.order_by(TranscriptSegment.position).offset(offset).limit(limit + 1)
+        )
+    ).all()
+
+    return TranscriptSegmentPage(
+        transcription_id=transcription.id,
+        segments=segments[:limit],
+        next_offset=offset + limit if len(segments) > limit else None,
+    )
+
+
+@router.get("/{video_id}/transcriptions", response_model=list[TranscriptionResponse])
+async def list_transcriptions(video_id: str, db: AsyncSession = Depends(get_async_db)):
+    video = await db.get(Video, video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    transcriptions = (
-        db.query(Transcription)
-        .filter(Transcription.video_id == video_id)
+    transcriptions = await db.scalars(
+        select(Transcription)
+        .where(Transcription.video_id == video_id)
         .order_by(Transcription.created_at.desc())
-        .all()
     )
-    return transcriptions
+    return transcriptions.all()
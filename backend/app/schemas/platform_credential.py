@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class PlatformCredentialCreate(BaseModel):
@@ -9,6 +9,9 @@ class PlatformCredentialCreate(BaseModel):
     auth_type: str  # "cookies" or "login"
     username: str | None = None
     password: str | None = None
+    concurrent_fragments: int | None = Field(None, ge=1, le=64)
+    http_chunk_size_mb: int | None = Field(None, ge=0)
+    retries: int | None = Field(None, ge=0)
 
 
 class PlatformCredentialUpdate(BaseModel):
@@ -17,6 +20,9 @@ class PlatformCredentialUpdate(BaseModel):
     auth_type: str | None = None
     username: str | None = None
     password: str | None = None
+    concurrent_fragments: int | None = Field(None, ge=1, le=64)
+    http_chunk_size_mb: int | None = Field(None, ge=0)
+    retries: int | None = Field(None, ge=0)
 
 
 class PlatformCredentialResponse(BaseModel):
@@ -27,6 +33,9 @@ class PlatformCredentialResponse(BaseModel):
     username: str | None = None
     password: str | None = None
     cookies_path: str | None = None
+    concurrent_fragments: int | None = None
+    http_chunk_size_mb: int | None = None
+    retries: int | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -42,6 +51,9 @@ class PlatformCredentialResponse(BaseModel):
             username=credential.username,
             password="••••••" if credential.password else None,
             cookies_path=credential.cookies_path,
+            concurrent_fragments=credential.concurrent_fragments,
+            http_chunk_size_mb=credential.http_chunk_size_mb,
+            retries=credential.retries,
             created_at=credential.created_at,
             updated_at=credential.updated_at,
         )
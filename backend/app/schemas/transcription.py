@@ -12,6 +12,22 @@ class TranscriptionResponse(BaseModel):
     raw_text: str | None = None
     markdown_path: str | None = None
     duration_seconds: int | None = None
+    real_time_factor: float | None = None
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class TranscriptSegmentResponse(BaseModel):
+    position: int
+    start_seconds: float
+    end_seconds: float
+    text: str
+
+    model_config = {"from_attributes": True}
+
+
+class TranscriptSegmentPage(BaseModel):
+    transcription_id: str
+    segments: list[TranscriptSegmentResponse]
+    next_offset: int | None = None
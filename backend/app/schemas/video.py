@@ -1,11 +1,14 @@
 from datetime import datetime
 
+from typing import Literal
+
 from pydantic import BaseModel
 
 
 class VideoCreate(BaseModel):
     url: str
     playlist_id: str | None = None
+    download_mode: Literal["audio", "video"] | None = None
 
 
 class VideoResponse(BaseModel):
@@ -16,6 +19,7 @@ class VideoResponse(BaseModel):
     duration_seconds: int | None = None
     thumbnail_url: str | None = None
     channel_name: str | None = None
+    download_mode: str | None = None
     status: str
     error_message: str | None = None
     video_path: str | None = None
@@ -27,6 +31,13 @@ class VideoResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class VideoSearchResult(BaseModel):
+    video: VideoResponse
+    snippet: str
+    rank: float
+    start_seconds: float | None = None
+
+
 class VideoTranscribe(BaseModel):
-    engine: str | None = None
+    engine: Literal["whisper_local", "faster_whisper", "openai_api"] | None = None
     model_name: str | None = None
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, model_validator
+
+
+class VideoImportCreate(BaseModel):
+    url: str | None = None
+    urls: list[str] = []
+    playlist_id: str | None = None
+    create_playlist: bool = False
+    download_mode: Literal["audio", "video"] | None = None
+
+    @model_validator(mode="after")
+    def require_url(self):
+        if not self.url and not self.urls:
+            raise ValueError("Provide url or urls")
+        return self
+
+    def all_urls(self) -> list[str]:
+        return list(dict.fromkeys(([self.url] if self.url else []) + self.urls))
+
+
+class VideoImportResponse(BaseModel):
+    id: str
+    status: str
+    error_message: str | None = None
+    title: str | None = None
+    source_urls: list[str]
+    playlist_id: str | None = None
+    total: int
+    created_count: int
+    existing_count: int
+    status_counts: dict[str, int]
+    completed: int
+    failed: int
+    finished: bool
+    created_at: datetime
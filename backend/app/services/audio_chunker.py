@@ -0,0 +1,31 @@
+import wave
+
+import numpy as np
+
+FRAME_SECONDS = 0.03
+
+
+def wav_duration(audio_path: str) -> float:
+    with wave.open(audio_path, "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def read_wav(audio_path: str, start: int = 0, end: int | None = None) -> np.ndarray:
+    """Read mono 16-bit PCM samples [start, end) as float32 in [-1, 1]."""
+    with wave.open(audio_path, "rb") as wav:
+        total = wav.getnframes()
+        end = total if end is None else min(end, total)
+        wav.setpos(start)
+        raw = wav.readframes(max(0, end - start))
+    return np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def quietest_point(samples: np.ndarray, sample_rate: int) -> int:
+    """Return the sample offset of the lowest-energy frame in ``samples``."""
+    frame = max(1, int(sample_rate * FRAME_SECONDS))
+    count = len(samples) // frame
+    if count == 0:
+        return len(samples) // 2
+    frames = samples[: count * frame].reshape(count, frame)
+    energy = np.sqrt(np.mean(frames * frames, axis=1))
+    return int(np.argmin(energy)) * frame + frame // 2
@@ -1,27 +1,129 @@
 import os
 import subprocess
+from collections.abc import Callable, Iterator
+
+import numpy as np
 
 from app.config import settings
+from app.services.audio_chunker import quietest_point
+
+SAMPLE_RATE = 16000
 
 
-def extract_audio(video_id: str, video_path: str) -> str:
+def extract_audio(
+    video_id: str,
+    video_path: str,
+    progress: Callable[..., None] | None = None,
+    duration: float | None = None,
+) -> str:
     full_video_path = os.path.join(settings.storage_path, video_path)
     output_dir = os.path.join(settings.storage_path, "videos", video_id)
     audio_path = os.path.join(output_dir, "audio.wav")
 
-    subprocess.run(
-        [
-            "ffmpeg",
-            "-i", full_video_path,
-            "-vn",
-            "-acodec", "pcm_s16le",
-            "-ar", "16000",
-            "-ac", "1",
-            "-y",
-            audio_path,
-        ],
-        check=True,
-        capture_output=True,
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-loglevel", "error",
+        "-progress", "pipe:1",
+        "-nostats",
+        "-i", full_video_path,
+        "-vn",
+        "-acodec", "pcm_s16le",
+        "-ar", str(SAMPLE_RATE),
+        "-ac", "1",
+        "-y",
+        audio_path,
+    ]
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
     )
+    # -progress writes key=value blocks; out_time_us is the decoded position
+    # and "progress=end" closes the last one.
+    position = 0.0
+    for line in proc.stdout:
+        key, _, value = line.strip().partition("=")
+        if progress and key == "out_time_us" and value.isdigit():
+            position = int(value) / 1_000_000
+            progress(position_seconds=position, duration_seconds=duration)
+        elif progress and key == "progress" and value == "end":
+            progress(position_seconds=position, duration_seconds=duration, done=True)
+    stderr = proc.stderr.read()
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
 
     return os.path.join("videos", video_id, "audio.wav")
+
+
+def stream_audio(
+    video_path: str, window_seconds: float, search_seconds: float = 20.0
+) -> Iterator[tuple[float, np.ndarray]]:
+    """Decode media through an ffmpeg pipe into float32 PCM windows.
+
+    Yields ``(offset_seconds, samples)`` pairs. Each window is cut at the
+    quietest frame near its nominal end, and at most one window plus the
+    search margin is ever held in memory.
+    """
+    full_video_path = os.path.join(settings.storage_path, video_path)
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-loglevel", "error",
+        "-i", full_video_path,
+        "-vn",
+        "-f", "f32le",
+        "-acodec", "pcm_f32le",
+        "-ar", str(SAMPLE_RATE),
+        "-ac", "1",
+        "pipe:1",
+    ]
+    window = int(window_seconds * SAMPLE_RATE)
+    search = min(int(search_seconds * SAMPLE_RATE), window // 2)
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    buffer = np.empty(0, dtype=np.float32)
+    offset = 0
+    try:
+        while True:
+            data = proc.stdout.read((window + search - len(buffer)) * 4)
+            if data:
+                buffer = np.concatenate([buffer, np.frombuffer(data, dtype=np.float32)])
+            if not data or len(buffer) < window + search:
+                if len(buffer):
+                    yield offset / SAMPLE_RATE, buffer
+                break
+
+            tail = buffer[window - search:]
+            cut = window - search + quietest_point(tail, SAMPLE_RATE)
+            yield offset / SAMPLE_RATE, buffer[:cut]
+            buffer = buffer[cut:].copy()
+            offset += cut
+
+        proc.wait()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(
+                proc.returncode, cmd, stderr=proc.stderr.read()
+            )
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+def encode_opus(samples: np.ndarray, bitrate_kbps: int) -> bytes:
+    """Encode float32 PCM at SAMPLE_RATE to Ogg/Opus in memory."""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-loglevel", "error",
+        "-f", "s16le",
+        "-ar", str(SAMPLE_RATE),
+        "-ac", "1",
+        "-i", "pipe:0",
+        "-c:a", "libopus",
+        "-b:a", f"{bitrate_kbps}k",
+        "-application", "voip",
+        "-f", "ogg",
+        "pipe:1",
+    ]
+    return subprocess.run(cmd, input=pcm, capture_output=True, check=True).stdout
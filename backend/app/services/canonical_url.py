@@ -0,0 +1,52 @@
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from yt_dlp.extractor import gen_extractor_classes
+
+# Query parameters that never change which media a URL points to.
+_TRACKING_PARAMS = {"si", "feature", "pp", "t", "ab_channel", "fbclid", "gclid"}
+# Playlist context on a single-video URL (e.g. watch?v=...&list=...&index=3).
+_PLAYLIST_CONTEXT_PARAMS = {"list", "index", "start_radio"}
+
+_extractors = None
+
+
+def normalize_url(url: str) -> str:
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parsed.port:
+        host = f"{host}:{parsed.port}"
+
+    params = parse_qsl(parsed.query, keep_blank_values=True)
+    has_video_id = any(key == "v" for key, _ in params)
+    params = sorted(
+        (key, value)
+        for key, value in params
+        if key not in _TRACKING_PARAMS
+        and not key.startswith("utm_")
+        and not (has_video_id and key in _PLAYLIST_CONTEXT_PARAMS)
+    )
+
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse(((parsed.scheme or "https").lower(), host, path, "", urlencode(params), ""))
+
+
+def canonical_key(url: str) -> str:
+    """Identify the media behind ``url`` as "<extractor>:<id>" without network access.
+
+    Falls back to the normalized URL when no specific yt-dlp extractor
+    recognizes it.
+    """
+    global _extractors
+    if _extractors is None:
+        _extractors = [ie for ie in gen_extractor_classes() if ie.ie_key() != "Generic"]
+
+    normalized = normalize_url(url)
+    for ie in _extractors:
+        if ie.suitable(normalized):
+            media_id = ie.get_temp_id(normalized)
+            if media_id:
+                return f"{ie.ie_key()}:{media_id}"
+            break
+    return normalized
@@ -0,0 +1,99 @@
+import threading
+from urllib.parse import urlparse
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.platform_credential import PlatformCredential
+
+
+def _host_key(platform_url: str) -> str:
+    value = platform_url.strip().lower()
+    host = urlparse(value if "://" in value else f"//{value}").hostname or ""
+    return host.removeprefix("www.").rstrip(".")
+
+
+class CredentialIndex:
+    """Hostname-suffix index of platform credentials, loaded once and kept in memory.
+
+    ``lookup`` walks the URL's hostname from the most specific suffix to
+    the least, so ``fullcycle.com.br`` never matches a ``cycle.com``
+    credential while ``app.fullcycle.com.br`` still matches
+    ``fullcycle.com.br``. Entries without a dot (e.g. ``youtube``) match
+    any hostname having that label.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_suffix: dict[str, PlatformCredential] | None = None
+        self._by_label: dict[str, PlatformCredential] = {}
+
+    def lookup(self, url: str) -> PlatformCredential | None:
+        host = (urlparse(url).hostname or "").lower().rstrip(".")
+        if not host:
+            return None
+        by_suffix, by_label = self._load()
+
+        labels = host.split(".")
+        for i in range(len(labels)):
+            credential = by_suffix.get(".".join(labels[i:]))
+            if credential:
+                return credential
+        for label in labels:
+            credential = by_label.get(label)
+            if credential:
+                return credential
+        return None
+
+    def invalidate(self):
+        with self._lock:
+            self._by_suffix = None
+            self._by_label = {}
+
+    def _load(self) -> tuple[dict[str, PlatformCredential], dict[str, PlatformCredential]]:
+        with self._lock:
+            if self._by_suffix is not None:
+                return self._by_suffix, self._by_label
+
+            db = SessionLocal()
+            try:
+                credentials = (
+                    db.query(PlatformCredential)
+                    .order_by(PlatformCredential.created_at)
+                    .all()
+                )
+                db.expunge_all()
+            finally:
+                db.close()
+
+            by_suffix, by_label = {}, {}
+            # Oldest first wins, matching the previous first-match behaviour.
+            for credential in credentials:
+                key = _host_key(credential.platform_url)
+                if key:
+                    (by_suffix if "." in key else by_label).setdefault(key, credential)
+            self._by_suffix, self._by_label = by_suffix, by_label
+            return by_suffix, by_label
+
+
+credential_index = CredentialIndex()
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_dirty(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, PlatformCredential):
+            session.info["credentials_dirty"] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate(session):
+    if session.info.pop("credentials_dirty", False):
+        credential_index.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session):
+    session.info.pop("credentials_dirty", None)
@@ -1,62 +1,229 @@
+import logging
 import os
-from urllib.parse import urlparse
+import urllib.error
+from collections.abc import Callable
 
 import yt_dlp
-from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models.platform_credential import PlatformCredential
+from app.services.credential_index import credential_index
+from app.services import subtitles
 
+logger = logging.getLogger(__name__)
+
+
+# Leftovers of an interrupted download, kept so a retry can resume them.
+_PARTIAL_SUFFIXES = (".part", ".ytdl", ".temp")
+
+
+def _credential_opts(credential: PlatformCredential | None) -> dict:
+    """yt-dlp authentication options for ``credential``."""
+    if not credential:
+        return {}
+    if credential.auth_type == "cookies" and credential.cookies_path:
+        cookies_abs = os.path.join(settings.storage_path, credential.cookies_path)
+        if os.path.exists(cookies_abs):
+            return {"cookiefile": cookies_abs}
+    elif credential.auth_type == "login" and credential.username:
+        return {"username": credential.username, "password": credential.password or ""}
+    return {}
+
+
+def _transfer_opts(credential: PlatformCredential | None) -> dict:
+    """Fragment parallelism, ranged requests and retries, tunable per credential."""
+
+    def pick(field: str, default: int) -> int:
+        value = getattr(credential, field, None) if credential else None
+        return default if value is None else value
+
+    retries = pick("retries", settings.download_retries)
+    opts = {
+        "concurrent_fragment_downloads": max(
+            1, pick("concurrent_fragments", settings.download_concurrent_fragments)
+        ),
+        # Resume .part files and fragment downloads left by an earlier attempt.
+        "continuedl": True,
+        "retries": retries,
+        "fragment_retries": retries,
+        "skip_unavailable_fragments": False,
+    }
+    chunk_mb = pick("http_chunk_size_mb", settings.download_http_chunk_size_mb)
+    if chunk_mb > 0:
+        # Ranged requests keep throttled hosts from stalling a single long GET.
+        opts["http_chunk_size"] = chunk_mb * 1024 * 1024
+    return opts
+
+
+def expand_url(url: str, max_items: int = 1000) -> dict:
+    """List the media behind a playlist/channel URL without downloading anything.
+
+    Uses yt-dlp flat extraction, so a whole playlist costs a few page
+    requests. A single-video URL expands to itself.
+    """
+    ydl_opts = {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "extract_flat": "in_playlist",
+        "playlistend": max_items,
+    }
+    ydl_opts.update(_credential_opts(credential_index.lookup(url)))
+
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+        entries = []
+        _collect_entries(ydl, info, entries, max_items)
+
+    return {"title": info.get("title"), "entries": entries}
 
-def _find_credential(db: Session, url: str) -> PlatformCredential | None:
-    domain = urlparse(url).hostname or ""
-    credentials = db.query(PlatformCredential).all()
-    for cred in credentials:
-        if cred.platform_url in domain:
-            return cred
-    return None
 
+def _collect_entries(ydl, info: dict, entries: list[dict], max_items: int, depth: int = 0):
+    if info.get("_type") not in ("playlist", "multi_video"):
+        entries.append(_entry(info))
+        return
 
-def download_video(video_id: str, url: str, db: Session | None = None) -> dict:
+    for item in info.get("entries") or []:
+        if len(entries) >= max_items:
+            return
+        if not item:
+            continue
+        if item.get("_type") == "playlist":
+            _collect_entries(ydl, item, entries, max_items, depth + 1)
+        elif (
+            item.get("_type") == "url"
+            and item.get("ie_key") == info.get("extractor_key")
+            and depth < 2
+        ):
+            # A link back into the same playlist extractor, e.g. a channel's tabs.
+            nested = ydl.extract_info(item["url"], download=False, process=True)
+            _collect_entries(ydl, nested, entries, max_items, depth + 1)
+        elif item.get("url") or item.get("webpage_url"):
+            entries.append(_entry(item))
+
+
+def _entry(item: dict) -> dict:
+    url = item.get("webpage_url") or item.get("url")
+    ie_key = item.get("ie_key") or item.get("extractor_key")
+    canonical_key = None
+    if ie_key and ie_key != "Generic" and item.get("id"):
+        canonical_key = f"{ie_key}:{item['id']}"
+    thumbnails = item.get("thumbnails") or []
+    return {
+        "url": url,
+        "canonical_key": canonical_key,
+        "title": item.get("title"),
+        "duration_seconds": int(item["duration"]) if item.get("duration") else None,
+        "thumbnail_url": item.get("thumbnail") or (thumbnails[-1].get("url") if thumbnails else None),
+        "channel_name": item.get("channel") or item.get("uploader"),
+    }
+
+
+def download_video(
+    video_id: str,
+    url: str,
+    mode: str = "audio",
+    progress: Callable[..., None] | None = None,
+    subtitles_policy: str | None = None,
+) -> dict:
+    """Download the media of ``url`` and return its metadata.
+
+    With a ``subtitles_policy`` the page is probed first, and when it
+    carries captions good enough for that policy they are returned under
+    ``"subtitles"`` and no media is downloaded.
+    """
     output_dir = os.path.join(settings.storage_path, "videos", video_id)
     os.makedirs(output_dir, exist_ok=True)
 
+    # The file keeps the "video." prefix in both modes; it is the pipeline's media source.
     output_template = os.path.join(output_dir, "video.%(ext)s")
 
     ydl_opts = {
-        "format": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best",
         "outtmpl": output_template,
-        "merge_output_format": "mp4",
         "quiet": True,
         "no_warnings": True,
     }
+    if mode == "video":
+        ydl_opts["format"] = "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"
+        ydl_opts["merge_output_format"] = "mp4"
+    else:
+        ydl_opts["format"] = "bestaudio[ext=m4a]/bestaudio/best"
+
+    if progress:
+        ydl_opts["progress_hooks"] = [_progress_hook(progress)]
 
-    # Apply platform credentials if available
-    if db:
-        credential = _find_credential(db, url)
-        if credential:
-            if credential.auth_type == "cookies" and credential.cookies_path:
-                cookies_abs = os.path.join(settings.storage_path, credential.cookies_path)
-                if os.path.exists(cookies_abs):
-                    ydl_opts["cookiefile"] = cookies_abs
-            elif credential.auth_type == "login" and credential.username:
-                ydl_opts["username"] = credential.username
-                ydl_opts["password"] = credential.password or ""
+    credential = credential_index.lookup(url)
+    ydl_opts.update(_transfer_opts(credential))
+    ydl_opts.update(_credential_opts(credential))
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(url, download=True)
+        if subtitles_policy:
+            info = ydl.extract_info(url, download=False)
+            captions = _fetch_subtitles(ydl, info, subtitles_policy)
+            if captions:
+                return {**_metadata(info), "video_path": None, "subtitles": captions}
+            # Download from the probe, as --load-info-json does, instead of re-extracting.
+            info = ydl.process_ie_result(ydl.sanitize_info(info), download=True)
+        else:
+            info = ydl.extract_info(url, download=True)
+
+    return {**_metadata(info), "video_path": _media_path(info, output_dir, video_id)}
+
 
-    video_path = None
-    for f in os.listdir(output_dir):
-        if f.startswith("video."):
-            video_path = os.path.join("videos", video_id, f)
-            break
+def _metadata(info: dict) -> dict:
+    canonical_key = None
+    if info.get("extractor_key") and info["extractor_key"] != "Generic" and info.get("id"):
+        canonical_key = f"{info['extractor_key']}:{info['id']}"
 
     return {
+        "canonical_key": canonical_key,
         "title": info.get("title"),
         "description": info.get("description"),
         "duration_seconds": info.get("duration"),
         "thumbnail_url": info.get("thumbnail"),
         "channel_name": info.get("channel") or info.get("uploader"),
-        "video_path": video_path,
     }
+
+
+def _fetch_subtitles(ydl, info: dict, policy: str) -> dict | None:
+    track = subtitles.pick_track(info, policy)
+    if not track:
+        return None
+    kind, language, track_url = track
+    # urlopen goes through yt-dlp's session, so cookies and headers apply.
+    try:
+        with ydl.urlopen(track_url) as response:
+            segments = subtitles.parse_vtt(response.read().decode("utf-8", errors="replace"))
+    except (yt_dlp.utils.YoutubeDLError, urllib.error.URLError, OSError) as e:
+        # Captions are only a shortcut; the download must not fail over them.
+        logger.warning("Could not fetch %s subtitles (%s): %s", kind, language, e)
+        return None
+    if not subtitles.good_enough(segments, info.get("duration")):
+        return None
+    return {"kind": kind, "language": language, "segments": segments}
+
+
+def _media_path(info: dict, output_dir: str, video_id: str) -> str | None:
+    downloads = info.get("requested_downloads") or []
+    if downloads and downloads[0].get("filepath") and os.path.exists(downloads[0]["filepath"]):
+        return os.path.join("videos", video_id, os.path.basename(downloads[0]["filepath"]))
+
+    for f in sorted(os.listdir(output_dir)):
+        if f.startswith("video.") and not f.endswith(_PARTIAL_SUFFIXES):
+            return os.path.join("videos", video_id, f)
+    return None
+
+
+def _progress_hook(progress: Callable[..., None]) -> Callable[[dict], None]:
+    def hook(d: dict):
+        if d.get("status") not in ("downloading", "finished"):
+            return
+        progress(
+            downloaded_bytes=d.get("downloaded_bytes"),
+            total_bytes=d.get("total_bytes") or d.get("total_bytes_estimate"),
+            speed=d.get("speed"),
+            eta=d.get("eta"),
+            done=d["status"] == "finished",
+        )
+
+    return hook
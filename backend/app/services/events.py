@@ -0,0 +1,131 @@
+import asyncio
+import itertools
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.video import Video
+
+
+@dataclass
+class Event:
+    id: int
+    type: str
+    video_id: str
+    data: dict = field(default_factory=dict)
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue
+    video_id: str | None
+
+
+class EventBus:
+    """In-process fan-out of pipeline events to async subscribers.
+
+    ``publish`` may be called from any thread (pipeline workers, the video
+    writer); events are handed to each subscriber's event loop. Subscriber
+    queues are bounded and drop their oldest event when a client falls
+    behind, so a slow stream never blocks the pipeline.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: list[_Subscriber] = []
+        self._ids = itertools.count(1)
+
+    def publish(self, video_id: str, type: str, **data):
+        with self._lock:
+            if not self._subscribers:
+                return
+            subscribers = list(self._subscribers)
+            event = Event(next(self._ids), type, video_id, data)
+        for sub in subscribers:
+            if sub.video_id is not None and sub.video_id != video_id:
+                continue
+            try:
+                sub.loop.call_soon_threadsafe(_offer, sub.queue, event)
+            except RuntimeError:
+                # The subscriber's loop is gone; it will never unsubscribe itself.
+                self._remove(sub)
+
+    @asynccontextmanager
+    async def subscribe(self, video_id: str | None = None) -> AsyncIterator[asyncio.Queue]:
+        """Yield a queue receiving events for ``video_id``, or for every video."""
+        sub = _Subscriber(
+            asyncio.get_running_loop(),
+            asyncio.Queue(maxsize=settings.events_queue_size),
+            video_id,
+        )
+        with self._lock:
+            self._subscribers.append(sub)
+        try:
+            yield sub.queue
+        finally:
+            self._remove(sub)
+
+    def _remove(self, sub: _Subscriber):
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+
+
+def _offer(queue: asyncio.Queue, event: Event):
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+def progress_reporter(video_id: str, stage: str) -> Callable[..., None]:
+    """Return a callback publishing ``progress`` events for one stage, rate limited.
+
+    A call with ``done=True`` marks the end of the stage and is always
+    published, so subscribers see the final figures.
+    """
+    last = 0.0
+
+    def report(done: bool = False, **data):
+        nonlocal last
+        now = time.monotonic()
+        if not done and now - last < settings.events_progress_interval:
+            return
+        last = now
+        event_bus.publish(video_id, "progress", stage=stage, **data)
+
+    return report
+
+
+event_bus = EventBus()
+
+
+# Status transitions are published once committed, whichever session made
+# them (video writer, pipeline or API), so subscribers can trust a refetch.
+@event.listens_for(Session, "after_flush")
+def _collect_status_changes(session, flush_context):
+    for obj in (*session.new, *session.dirty):
+        if isinstance(obj, Video) and inspect(obj).attrs.status.history.has_changes():
+            session.info.setdefault("video_events", {})[obj.id] = (
+                "status", {"status": obj.status}
+            )
+    for obj in session.deleted:
+        if isinstance(obj, Video):
+            session.info.setdefault("video_events", {})[obj.id] = ("deleted", {})
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_status_changes(session):
+    for video_id, (type, data) in session.info.pop("video_events", {}).items():
+        event_bus.publish(video_id, type, **data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_status_changes(session):
+    session.info.pop("video_events", None)
@@ -0,0 +1,119 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.playlist import Playlist
+from app.models.video import Video
+from app.models.video_import import VideoImport
+from app.services import playlists as playlist_service
+from app.services.canonical_url import canonical_key
+from app.services.downloader import expand_url
+from app.tasks.queue import enqueue_many
+
+_TERMINAL = ("completed", "failed")
+
+
+def create_import(
+    db: Session,
+    urls: list[str],
+    playlist_id: str | None = None,
+    create_playlist: bool = False,
+    download_mode: str | None = None,
+) -> VideoImport:
+    """Record a pending import; the import worker expands it."""
+    video_import = VideoImport(
+        source_urls=urls,
+        playlist_id=playlist_id,
+        create_playlist=create_playlist,
+        download_mode=download_mode,
+    )
+    db.add(video_import)
+    return video_import
+
+
+def expand_urls(urls: list[str]) -> list[dict]:
+    """List the media behind each URL; slow, so call it outside any transaction."""
+    return [expand_url(url, settings.import_max_items) for url in urls]
+
+
+def stage_import(db: Session, video_import: VideoImport, expanded: list[dict]):
+    """Stage every expanded item of ``video_import`` in the caller's transaction.
+
+    Media already known (by canonical key) is linked rather than created
+    again. New videos get their download job in the same transaction.
+    """
+    entries: dict[str, dict] = {}
+    for result in expanded:
+        for entry in result["entries"]:
+            key = entry["canonical_key"] or canonical_key(entry["url"])
+            entries.setdefault(key, entry)
+    keys = list(entries)[: settings.import_max_items]
+
+    existing = dict(
+        db.query(Video.canonical_key, Video.id).filter(Video.canonical_key.in_(keys))
+    )
+    title = next((r["title"] for r in expanded if r["title"]), None)
+
+    playlist_id = video_import.playlist_id
+    if playlist_id is None and video_import.create_playlist:
+        playlist = Playlist(name=title or "Import")
+        db.add(playlist)
+        db.flush()
+        playlist_id = playlist.id
+
+    video_import.title = title
+    video_import.playlist_id = playlist_id
+
+    new_videos = {
+        key: Video(
+            url=entries[key]["url"],
+            canonical_key=key,
+            title=entries[key]["title"],
+            duration_seconds=entries[key]["duration_seconds"],
+            thumbnail_url=entries[key]["thumbnail_url"],
+            channel_name=entries[key]["channel_name"],
+            download_mode=video_import.download_mode,
+            import_id=video_import.id,
+        )
+        for key in keys
+        if key not in existing
+    }
+    db.add_all(new_videos.values())
+    db.flush()
+
+    video_ids = [existing.get(key) or new_videos[key].id for key in keys]
+    video_import.video_ids = video_ids
+    video_import.created_count = len(new_videos)
+    video_import.existing_count = len(keys) - len(new_videos)
+
+    if playlist_id:
+        playlist_service.add_videos(db, playlist_id, video_ids)
+    enqueue_many(db, [v.id for v in new_videos.values()])
+    video_import.status = "ready"
+
+
+def import_progress(db: Session, video_import: VideoImport) -> dict:
+    status_counts = dict(
+        db.execute(
+            select(Video.status, func.count(Video.id))
+            .where(Video.id.in_(video_import.video_ids))
+            .group_by(Video.status)
+        ).all()
+    )
+    return {
+        "id": video_import.id,
+        "status": video_import.status,
+        "error_message": video_import.error_message,
+        "title": video_import.title,
+        "source_urls": video_import.source_urls,
+        "playlist_id": video_import.playlist_id,
+        "total": len(video_import.video_ids),
+        "created_count": video_import.created_count,
+        "existing_count": video_import.existing_count,
+        "status_counts": status_counts,
+        "completed": status_counts.get("completed", 0),
+        "failed": status_counts.get("failed", 0),
+        "finished": video_import.status == "failed"
+        or (video_import.status == "ready" and all(s in _TERMINAL for s in status_counts)),
+        "created_at": video_import.created_at,
+    }
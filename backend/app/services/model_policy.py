@@ -0,0 +1,65 @@
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.job import Job
+from app.models.transcription import Transcription
+from app.models.video import Video
+from app.services.transcriber import LOCAL_ENGINES
+
+# Queue priority of idle-time re-transcriptions; any regular job runs first.
+UPGRADE_PRIORITY = -10
+
+
+def adaptive() -> bool:
+    return settings.model_policy == "adaptive" and settings.model_fast != settings.whisper_model
+
+
+def backlog(db: Session) -> int:
+    """Regular jobs still waiting in any stage."""
+    return db.query(func.count(Job.id)).filter(
+        Job.status == "queued", Job.priority >= 0
+    ).scalar()
+
+
+def choose_model(db: Session, engine: str, duration_seconds: int | None) -> str:
+    """Model for a job that did not ask for one.
+
+    Under the adaptive policy, long videos and jobs arriving behind a
+    backlog get ``model_fast`` so a first transcript lands quickly; the
+    rest get ``whisper_model``. Fast transcripts are upgraded later, when
+    the queue is idle.
+    """
+    if not adaptive() or engine not in LOCAL_ENGINES:
+        return settings.whisper_model
+    if (duration_seconds or 0) >= settings.model_long_seconds:
+        return settings.model_fast
+    if backlog(db) >= settings.model_backlog_threshold:
+        return settings.model_fast
+    return settings.whisper_model
+
+
+def upgrade_candidate(db: Session) -> Transcription | None:
+    """Oldest fast-model transcription whose video has no ``whisper_model`` one yet.
+
+    Videos whose upgrade already failed are not retried.
+    """
+    upgraded = select(Transcription.video_id).where(
+        Transcription.model_name == settings.whisper_model,
+        Transcription.engine.in_(LOCAL_ENGINES),
+    )
+    failed = select(Job.video_id).where(Job.priority == UPGRADE_PRIORITY, Job.status == "failed")
+    return (
+        db.query(Transcription)
+        .join(Video, Video.id == Transcription.video_id)
+        .filter(
+            Transcription.model_name == settings.model_fast,
+            Transcription.engine.in_(LOCAL_ENGINES),
+            Transcription.video_id.not_in(upgraded),
+            Transcription.video_id.not_in(failed),
+            Video.status == "completed",
+            or_(Video.audio_path.is_not(None), Video.video_path.is_not(None)),
+        )
+        .order_by(Transcription.created_at)
+        .first()
+    )
@@ -0,0 +1,132 @@
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    def __init__(self, model, size_mb: float):
+        self.model = model
+        self.size_mb = size_mb
+        # Whisper installs kv-cache hooks on the module while decoding, so a
+        # model instance must only run one transcription at a time.
+        self.lock = threading.Lock()
+
+
+def _load_whisper(name: str, threads: int):
+    import whisper
+
+    return whisper.load_model(name)
+
+
+def _load_faster_whisper(name: str, threads: int):
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        name,
+        device="cpu",
+        compute_type=settings.faster_whisper_compute_type,
+        cpu_threads=settings.faster_whisper_cpu_threads or threads,
+    )
+
+
+LOADERS = {
+    "whisper_local": _load_whisper,
+    "faster_whisper": _load_faster_whisper,
+}
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _model_size_mb(model) -> float:
+    try:
+        return sum(p.numel() * p.element_size() for p in model.parameters()) / 2**20
+    except AttributeError:
+        return 0.0
+
+
+class ModelRegistry:
+    """Loaded models keyed by ``(engine, model_name)``, evicted LRU-first over budget."""
+
+    def __init__(self, loaders=LOADERS):
+        self._loaders = loaders
+        self._models: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._loading: dict[tuple[str, str], threading.Event] = {}
+        self._lock = threading.Lock()
+        # CPU threads per model; whisper_pool workers set their share of the cores.
+        self.threads = os.cpu_count() or 1
+
+    @contextmanager
+    def use(self, name: str, engine: str = "whisper_local"):
+        entry = self._get_entry((engine, name))
+        with entry.lock:
+            yield entry.model
+
+    def preload(self, name: str, engine: str = "whisper_local"):
+        self._get_entry((engine, name))
+
+    def loaded(self) -> list[dict]:
+        with self._lock:
+            return [
+                {"engine": engine, "model_name": name, "size_mb": round(entry.size_mb)}
+                for (engine, name), entry in self._models.items()
+            ]
+
+    def _get_entry(self, key: tuple[str, str]) -> _Entry:
+        while True:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry:
+                    self._models.move_to_end(key)
+                    return entry
+                pending = self._loading.get(key)
+                if pending is None:
+                    pending = threading.Event()
+                    self._loading[key] = pending
+                    break
+            # Another thread is loading the same weights; wait and re-check.
+            pending.wait()
+
+        try:
+            engine, model_name = key
+            before = rss_mb()
+            model = self._loaders[engine](model_name, self.threads)
+            # CTranslate2 models expose no parameters; fall back to the memory they took.
+            entry = _Entry(model, _model_size_mb(model) or max(0.0, rss_mb() - before))
+            with self._lock:
+                self._models[key] = entry
+                self._evict(keep=key)
+            return entry
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            pending.set()
+
+    def _evict(self, keep: tuple[str, str]):
+        budget = settings.whisper_model_cache_mb
+        total = sum(e.size_mb for e in self._models.values())
+        for key in list(self._models):
+            if total <= budget:
+                break
+            if key == keep:
+                continue
+            total -= self._models.pop(key).size_mb
+            logger.info("Evicted %s model %s from registry", *key)
+
+
+model_registry = ModelRegistry()
@@ -0,0 +1,76 @@
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import Session
+
+from app.models.playlist import Playlist, PlaylistVideo
+
+
+def add_videos(db: Session, playlist_id: str, video_ids: list[str]) -> int:
+    """Append videos not yet in the playlist, keeping ``video_count`` in step.
+
+    Runs a fixed number of queries regardless of how many ids are given.
+    """
+    present = {
+        video_id
+        for video_id, in db.query(PlaylistVideo.video_id).filter(
+            PlaylistVideo.playlist_id == playlist_id,
+            PlaylistVideo.video_id.in_(video_ids),
+        )
+    }
+    new_ids = list(dict.fromkeys(v for v in video_ids if v not in present))
+    if not new_ids:
+        return 0
+
+    last = (
+        db.query(func.max(PlaylistVideo.position))
+        .filter(PlaylistVideo.playlist_id == playlist_id)
+        .scalar()
+    )
+    start = -1 if last is None else last
+    db.add_all(
+        PlaylistVideo(playlist_id=playlist_id, video_id=video_id, position=start + 1 + i)
+        for i, video_id in enumerate(new_ids)
+    )
+    db.execute(
+        update(Playlist)
+        .where(Playlist.id == playlist_id)
+        .values(video_count=Playlist.video_count + len(new_ids))
+    )
+    return len(new_ids)
+
+
+def remove_video(db: Session, pv: PlaylistVideo):
+    db.delete(pv)
+    db.execute(
+        update(Playlist)
+        .where(Playlist.id == pv.playlist_id)
+        .values(video_count=Playlist.video_count - 1)
+    )
+
+
+def detach_video(db: Session, video_id: str):
+    """Decrement counts of every playlist holding a video that is about to be deleted."""
+    playlist_ids = db.query(PlaylistVideo.playlist_id).filter(
+        PlaylistVideo.video_id == video_id
+    )
+    db.execute(
+        update(Playlist)
+        .where(Playlist.id.in_(playlist_ids.scalar_subquery()))
+        .values(video_count=Playlist.video_count - 1)
+    )
+
+
+def reorder(db: Session, playlist_id: str, video_ids: list[str]):
+    if not video_ids:
+        return
+    position = case(
+        {video_id: i for i, video_id in enumerate(video_ids)},
+        value=PlaylistVideo.video_id,
+    )
+    db.execute(
+        update(PlaylistVideo)
+        .where(
+            PlaylistVideo.playlist_id == playlist_id,
+            PlaylistVideo.video_id.in_(video_ids),
+        )
+        .values(position=position)
+    )
@@ -0,0 +1,109 @@
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.models.transcription import Transcription, TranscriptSegment
+from app.models.video import Video
+
+CREATE_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS video_search USING fts5("
+    "video_id UNINDEXED, title, description, transcript, "
+    "tokenize = 'unicode61 remove_diacritics 2')"
+)
+
+
+def match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query: every term must match, the last as a prefix."""
+    terms = [t.replace('"', "") for t in query.split()]
+    terms = [t for t in terms if t]
+    if not terms:
+        return ""
+    quoted = [f'"{t}"' for t in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def index_video(db: Session, video_id: str):
+    video = db.query(Video).filter(Video.id == video_id).first()
+    if not video:
+        remove_video(db, video_id)
+        return
+
+    latest = (
+        db.query(Transcription.raw_text)
+        .filter(Transcription.video_id == video_id)
+        .order_by(Transcription.created_at.desc())
+        .first()
+    )
+    remove_video(db, video_id)
+    db.execute(
+        text(
+            "INSERT INTO video_search (video_id, title, description, transcript) "
+            "VALUES (:video_id, :title, :description, :transcript)"
+        ),
+        {
+            "video_id": video_id,
+            "title": video.title or "",
+            "description": video.description or "",
+            "transcript": latest.raw_text if latest and latest.raw_text else "",
+        },
+    )
+
+
+def remove_video(db: Session, video_id: str):
+    db.execute(text("DELETE FROM video_search WHERE video_id = :video_id"), {"video_id": video_id})
+
+
+def matching_ids(query: str):
+    """Subquery of video ids matching ``query``, for use in ``Video.id.in_(...)``."""
+    return text("SELECT video_id FROM video_search WHERE video_search MATCH :match").bindparams(
+        match=match_expression(query)
+    )
+
+
+def search(db: Session, query: str, limit: int = 20) -> list[tuple[str, str, float]]:
+    """Return ``(video_id, snippet, rank)`` for the best matches, best first."""
+    match = match_expression(query)
+    if not match:
+        return []
+    rows = db.execute(
+        text(
+            "SELECT video_id, "
+            "snippet(video_search, -1, '<mark>', '</mark>', '…', 16) AS snippet, "
+            "bm25(video_search, 0.0, 5.0, 2.0, 1.0) AS rank "
+            "FROM video_search WHERE video_search MATCH :match "
+            "ORDER BY rank LIMIT :limit"
+        ),
+        {"match": match, "limit": limit},
+    ).all()
+    return [(row.video_id, row.snippet, row.rank) for row in rows]
+
+
+def locate(db: Session, video_ids: list[str], query: str) -> dict[str, float]:
+    """Start time of the first segment containing the query's longest term, per video.
+
+    Only each video's latest transcript is searched, all in one grouped query.
+    """
+    terms = [t.replace('"', "") for t in query.split()]
+    term = max(terms, key=len, default="")
+    if not term or not video_ids:
+        return {}
+
+    latest = (
+        select(
+            Transcription.id,
+            Transcription.video_id,
+            func.row_number()
+            .over(partition_by=Transcription.video_id, order_by=Transcription.created_at.desc())
+            .label("recency"),
+        )
+        .where(Transcription.video_id.in_(video_ids))
+        .subquery()
+    )
+    rows = (
+        db.query(latest.c.video_id, func.min(TranscriptSegment.start_seconds))
+        .join(TranscriptSegment, TranscriptSegment.transcription_id == latest.c.id)
+        .filter(latest.c.recency == 1, TranscriptSegment.text.ilike(f"%{term}%"))
+        .group_by(latest.c.video_id)
+        .all()
+    )
+    return dict(rows)
@@ -0,0 +1,97 @@
+import threading
+import uuid
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.playlist import Playlist
+from app.models.transcription import Transcription
+from app.models.video import Video
+from app.schemas.video import VideoResponse
+
+_TRACKED = (Video, Playlist, Transcription)
+
+# Generation counter bumped on every commit touching a tracked model; the
+# dashboard payload is only recomputed when it moves.
+_lock = threading.Lock()
+_generation = 0
+_cached: tuple[int, dict] | None = None
+_instance = uuid.uuid4().hex[:8]
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_dirty(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _TRACKED):
+            session.info["stats_dirty"] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dirty_bulk(state):
+    # Core-style update()/delete()/insert() statements never reach the flush.
+    if state.is_update or state.is_delete or state.is_insert:
+        if any(mapper.class_ in _TRACKED for mapper in state.all_mappers):
+            state.session.info["stats_dirty"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_generation(session):
+    global _generation
+    if session.info.pop("stats_dirty", False):
+        with _lock:
+            _generation += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session):
+    session.info.pop("stats_dirty", None)
+
+
+async def get_stats(db: AsyncSession) -> tuple[str, dict]:
+    """Return ``(etag, payload)``, hitting the database only after a relevant commit."""
+    global _cached
+    with _lock:
+        generation = _generation
+        cached = _cached
+    etag = f'W/"{_instance}-{generation}"'
+    if cached and cached[0] == generation:
+        return etag, cached[1]
+
+    payload = await db.run_sync(_compute)
+
+    with _lock:
+        if _cached is None or _cached[0] < generation:
+            _cached = (generation, payload)
+    return etag, payload
+
+
+def _compute(db: Session) -> dict:
+    by_status = dict(
+        db.query(Video.status, func.count(Video.id)).group_by(Video.status).all()
+    )
+    total_playlists, total_transcriptions = db.execute(
+        select(
+            select(func.count(Playlist.id)).scalar_subquery(),
+            select(func.count(Transcription.id)).scalar_subquery(),
+        )
+    ).one()
+    recent_videos = db.query(Video).order_by(Video.created_at.desc()).limit(5).all()
+
+    completed = by_status.get("completed", 0)
+    failed = by_status.get("failed", 0)
+    pending = by_status.get("pending", 0)
+    total_videos = sum(by_status.values())
+
+    return {
+        "total_videos": total_videos,
+        "completed": completed,
+        "processing": total_videos - completed - failed - pending,
+        "failed": failed,
+        "total_playlists": total_playlists,
+        "total_transcriptions": total_transcriptions,
+        "recent_videos": [
+            VideoResponse.model_validate(v).model_dump(mode="json") for v in recent_videos
+        ],
+    }
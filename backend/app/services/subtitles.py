@@ -0,0 +1,99 @@
+import html
+import re
+
+from app.config import settings
+
+_TIMING = re.compile(
+    r"(?:(\d+):)?(\d{2}):(\d{2})[.,](\d{3})\s+-->\s+(?:(\d+):)?(\d{2}):(\d{2})[.,](\d{3})"
+)
+_TAG = re.compile(r"<[^>]*>")
+
+
+def _seconds(hours: str | None, minutes: str, seconds: str, millis: str) -> float:
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds) + int(millis) / 1000
+
+
+def parse_vtt(text: str) -> list[dict]:
+    """Parse WebVTT cues into ``{"start", "end", "text"}`` segments.
+
+    Auto-generated captions repeat the previous line in every cue while the
+    next one scrolls in; lines already shown by the previous cue are
+    dropped, so each spoken line appears once, timed from the cue that
+    introduced it.
+    """
+    segments = []
+    previous: list[str] = []
+    # Only empty lines end a cue; YouTube pads cues with lines holding a space.
+    for block in re.split(r"\n\n+", text.replace("\r\n", "\n")):
+        lines = block.split("\n")
+        for i, line in enumerate(lines):
+            timing = _TIMING.search(line)
+            if timing:
+                break
+        else:
+            continue
+
+        groups = timing.groups()
+        start, end = _seconds(*groups[:4]), _seconds(*groups[4:])
+        cue = [html.unescape(_TAG.sub("", line)).strip() for line in lines[i + 1:]]
+        cue = [line for line in cue if line]
+        new = [line for line in cue if line not in previous]
+        if new:
+            segments.append(
+                {"start": round(start, 3), "end": round(end, 3), "text": " ".join(new)}
+            )
+        previous = cue
+    return segments
+
+
+def coverage(segments: list[dict], duration: float | None) -> float:
+    """Fraction of ``duration`` covered by at least one cue."""
+    if not duration:
+        return 1.0 if segments else 0.0
+    covered = 0.0
+    reach = 0.0
+    for seg in sorted(segments, key=lambda s: s["start"]):
+        start = max(seg["start"], reach)
+        if seg["end"] > start:
+            covered += seg["end"] - start
+            reach = seg["end"]
+    return min(1.0, covered / duration)
+
+
+def pick_track(info: dict, policy: str) -> tuple[str, str, str] | None:
+    """Choose a VTT track from yt-dlp info as ``(kind, language, url)``.
+
+    Only tracks in SUBTITLES_LANGUAGES, or in the video's own language when
+    that is empty, are accepted, since a caption in any other language is a
+    translation rather than a transcript. Manual captions win over
+    auto-generated ones, which are only considered with the "any" policy.
+    """
+    preferred = [lang.strip() for lang in settings.subtitles_languages.split(",") if lang.strip()]
+    if not preferred and info.get("language"):
+        preferred = [info["language"]]
+
+    sources = [("manual", info.get("subtitles") or {})]
+    if policy == "any":
+        sources.append(("auto", info.get("automatic_captions") or {}))
+
+    for kind, tracks in sources:
+        languages = [lang for lang in tracks if lang != "live_chat"]
+        if preferred:
+            candidates = [
+                lang
+                for wanted in preferred
+                for lang in languages
+                if lang == wanted or lang.startswith(f"{wanted}-")
+            ]
+        else:
+            # Unknown spoken language: a single manual track is almost surely it.
+            candidates = languages if kind == "manual" and len(languages) == 1 else []
+        for lang in candidates:
+            for fmt in tracks[lang]:
+                if fmt.get("ext") == "vtt" and fmt.get("url"):
+                    return kind, lang, fmt["url"]
+    return None
+
+
+def good_enough(segments: list[dict], duration: float | None) -> bool:
+    return bool(segments) and coverage(segments, duration) >= settings.subtitles_min_coverage
@@ -1,51 +1,321 @@
+import logging
 import os
 import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+import numpy as np
 
 from app.config import settings
+from app.services.audio_chunker import read_wav, wav_duration
+from app.services.audio_extractor import SAMPLE_RATE, encode_opus, stream_audio
+from app.services.model_registry import model_registry
+from app.services.vad import detect_speech, group_regions, remap_segments, speech_regions
+from app.services.whisper_pool import whisper_pool
+
+logger = logging.getLogger(__name__)
+
+LOCAL_ENGINES = ("whisper_local", "faster_whisper")
+ENGINES = (*LOCAL_ENGINES, "openai_api")
+
+OPENAI_MAX_UPLOAD_BYTES = 25 * 2**20
 
 
 def transcribe_audio(
-    audio_path: str,
+    audio_path: str | None,
     engine: str | None = None,
     model_name: str | None = None,
+    media_path: str | None = None,
+    progress: Callable[..., None] | None = None,
+    media_seconds: float | None = None,
 ) -> dict:
+    """Transcribe the extracted WAV, or stream ``media_path`` when there is none.
+
+    ``media_seconds`` is the media length when known; it is only needed to
+    compute the real-time factor of streamed transcriptions.
+    """
     engine = engine or settings.whisper_engine
     model_name = model_name or settings.whisper_model
-    full_audio_path = os.path.join(settings.storage_path, audio_path)
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown transcription engine: {engine}")
 
     start = time.time()
 
-    if engine == "openai_api":
-        text, language = _transcribe_openai(full_audio_path, model_name)
+    if audio_path is None:
+        if engine == "openai_api":
+            raise ValueError("openai_api engine requires an extracted audio file")
+        text, language, segments = whisper_pool.submit(
+            _transcribe_local_stream,
+            media_path,
+            engine,
+            model_name,
+            settings.vad_enabled,
+            progress=progress,
+        ).result()
+        audio_seconds = media_seconds
     else:
-        text, language = _transcribe_local(full_audio_path, model_name)
+        full_audio_path = os.path.join(settings.storage_path, audio_path)
+        audio_seconds = wav_duration(full_audio_path)
+        if engine == "openai_api":
+            text, language, segments = _transcribe_openai(full_audio_path, model_name, progress)
+        else:
+            text, language, segments = _transcribe_local(
+                full_audio_path, engine, model_name, progress
+            )
 
-    elapsed = int(time.time() - start)
+    elapsed = time.time() - start
+    if progress:
+        progress(segments=len(segments), done=True)
 
     return {
         "engine": engine,
         "model_name": model_name,
         "language": language,
         "raw_text": text,
-        "duration_seconds": elapsed,
+        "segments": segments,
+        "duration_seconds": int(elapsed),
+        "real_time_factor": round(elapsed / audio_seconds, 3) if audio_seconds else None,
     }
 
 
-def _transcribe_local(audio_path: str, model_name: str) -> tuple[str, str]:
-    import whisper
+def _segments(result: dict, offset: float = 0.0) -> list[dict]:
+    return [
+        {
+            "start": round(seg["start"] + offset, 3),
+            "end": round(seg["end"] + offset, 3),
+            "text": seg["text"].strip(),
+        }
+        for seg in result.get("segments", [])
+    ]
+
+
+def _run_model(model, engine: str, audio: str | np.ndarray) -> dict:
+    """Transcribe with either local backend, returning openai-whisper's result shape."""
+    if engine == "faster_whisper":
+        segments, info = model.transcribe(audio, beam_size=settings.faster_whisper_beam_size)
+        segments = list(segments)
+        return {
+            "text": "".join(s.text for s in segments),
+            "language": info.language,
+            "segments": [{"start": s.start, "end": s.end, "text": s.text} for s in segments],
+        }
+    return model.transcribe(audio)
+
+
+def _transcribe_local(
+    audio_path: str,
+    engine: str,
+    model_name: str,
+    progress: Callable[..., None] | None = None,
+) -> tuple[str, str, list[dict]]:
+    regions = _speech(audio_path)
+    if regions == []:
+        return "", "", []
+
+    if settings.transcribe_chunked and wav_duration(audio_path) >= settings.chunked_min_seconds:
+        return _transcribe_local_chunked(audio_path, engine, model_name, progress, regions)
+    if regions is None:
+        return whisper_pool.submit(_transcribe_file, audio_path, engine, model_name).result()
+    return whisper_pool.submit(
+        _transcribe_regions, audio_path, regions, engine, model_name
+    ).result()
+
+
+def _speech(audio_path: str) -> list[tuple[int, int]] | None:
+    """Speech regions of the WAV, or None when VAD is disabled."""
+    if not settings.vad_enabled:
+        return None
+    regions = detect_speech(audio_path)
+    speech = sum(end - start for start, end in regions) / SAMPLE_RATE
+    logger.info("VAD kept %.0fs of speech out of %.0fs", speech, wav_duration(audio_path))
+    return regions
+
+
+def _chunk_groups(
+    audio_path: str, regions: list[tuple[int, int]] | None, chunk_seconds: int
+) -> list[list[tuple[int, int]]]:
+    """Sample ranges to transcribe together, one list per chunk.
+
+    Without VAD the whole file is one region, cut at pauses like any long
+    region, so no chunk exceeds ``chunk_seconds``.
+    """
+    if regions is None:
+        regions = [(0, round(wav_duration(audio_path) * SAMPLE_RATE))]
+    return group_regions(regions, chunk_seconds * SAMPLE_RATE, audio_path)
+
+
+def _gather(futures: list[Future], progress: Callable[..., None] | None) -> tuple[str, str, list[dict]]:
+    """Join per-chunk results in chunk order, reporting progress as chunks finish."""
+    if progress:
+        done_segments = 0
+        for done, future in enumerate(as_completed(futures), 1):
+            done_segments += len(future.result()[2])
+            progress(chunks_done=done, chunks_total=len(futures), segments=done_segments)
+    results = [f.result() for f in futures]
+
+    text = " ".join(chunk_text for chunk_text, _, _ in results if chunk_text)
+    languages = Counter(lang for _, lang, _ in results if lang)
+    language = languages.most_common(1)[0][0] if languages else ""
+    segments = [seg for _, _, chunk_segments in results for seg in chunk_segments]
+    return text, language, segments
 
-    model = whisper.load_model(model_name)
-    result = model.transcribe(audio_path)
-    return result["text"], result.get("language", "")
 
+# Runs inside a whisper_pool worker.
+def _transcribe_file(audio_path: str, engine: str, model_name: str) -> tuple[str, str, list[dict]]:
+    with model_registry.use(model_name, engine) as model:
+        result = _run_model(model, engine, audio_path)
+    return result["text"], result.get("language", ""), _segments(result)
 
-def _transcribe_openai(audio_path: str, model_name: str) -> tuple[str, str]:
+
+# Runs inside a whisper_pool worker; ffmpeg decodes straight into it.
+def _transcribe_local_stream(
+    media_path: str,
+    engine: str,
+    model_name: str,
+    vad: bool = False,
+    progress: Callable[..., None] | None = None,
+) -> tuple[str, str, list[dict]]:
+    texts = []
+    languages = Counter()
+    segments = []
+    with model_registry.use(model_name, engine) as model:
+        for offset, samples in stream_audio(media_path, settings.stream_window_seconds):
+            regions = speech_regions(samples, SAMPLE_RATE) if vad else [(0, len(samples))]
+            if regions:
+                speech = np.concatenate([samples[start:end] for start, end in regions])
+                result = _run_model(model, engine, speech)
+                result["segments"] = remap_segments(result["segments"], regions, SAMPLE_RATE)
+                texts.append(result["text"].strip())
+                if result.get("language"):
+                    languages[result["language"]] += 1
+                segments.extend(_segments(result, offset))
+            if progress:
+                progress(
+                    position_seconds=offset + len(samples) / SAMPLE_RATE,
+                    segments=len(segments),
+                )
+
+    language = languages.most_common(1)[0][0] if languages else ""
+    return " ".join(t for t in texts if t), language, segments
+
+
+# Runs inside a whisper_pool worker. Only the given sample ranges are
+# transcribed, back to back, with timestamps mapped to the original audio.
+def _transcribe_regions(
+    audio_path: str, regions: list[tuple[int, int]], engine: str, model_name: str
+) -> tuple[str, str, list[dict]]:
+    samples = np.concatenate([read_wav(audio_path, start, end) for start, end in regions])
+    with model_registry.use(model_name, engine) as model:
+        result = _run_model(model, engine, samples)
+    result["segments"] = remap_segments(result.get("segments", []), regions, SAMPLE_RATE)
+    return result["text"].strip(), result.get("language", ""), _segments(result)
+
+
+def _transcribe_local_chunked(
+    audio_path: str,
+    engine: str,
+    model_name: str,
+    progress: Callable[..., None] | None = None,
+    regions: list[tuple[int, int]] | None = None,
+) -> tuple[str, str, list[dict]]:
+    futures = [
+        whisper_pool.submit(_transcribe_regions, audio_path, group, engine, model_name)
+        for group in _chunk_groups(audio_path, regions, settings.chunk_seconds)
+    ]
+    return _gather(futures, progress)
+
+
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str, base_url: str, max_retries: int, timeout: float):
     from openai import OpenAI
 
-    client = OpenAI(api_key=settings.openai_api_key)
-    with open(audio_path, "rb") as f:
-        response = client.audio.transcriptions.create(
-            model=model_name or "whisper-1",
-            file=f,
+    # One client per configuration keeps its connection pool; the SDK retries
+    # 429/5xx with backoff.
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url or None,
+        max_retries=max_retries,
+        timeout=timeout,
+    )
+
+
+# Language names returned by the OpenAI API's verbose_json, as Whisper spells
+# them; the local engines report the ISO codes.
+_LANGUAGE_CODES = {
+    "english": "en", "chinese": "zh", "german": "de", "spanish": "es", "russian": "ru",
+    "korean": "ko", "french": "fr", "japanese": "ja", "portuguese": "pt", "turkish": "tr",
+    "polish": "pl", "catalan": "ca", "dutch": "nl", "arabic": "ar", "swedish": "sv",
+    "italian": "it", "indonesian": "id", "hindi": "hi", "finnish": "fi", "vietnamese": "vi",
+    "hebrew": "he", "ukrainian": "uk", "greek": "el", "malay": "ms", "czech": "cs",
+    "romanian": "ro", "danish": "da", "hungarian": "hu", "tamil": "ta", "norwegian": "no",
+    "thai": "th", "urdu": "ur", "croatian": "hr", "bulgarian": "bg", "lithuanian": "lt",
+    "latin": "la", "maori": "mi", "malayalam": "ml", "welsh": "cy", "slovak": "sk", "telugu": "te",
+    "persian": "fa", "latvian": "lv", "bengali": "bn", "serbian": "sr", "azerbaijani": "az",
+    "slovenian": "sl", "kannada": "kn", "estonian": "et", "macedonian": "mk", "breton": "br",
+    "basque": "eu", "icelandic": "is", "armenian": "hy", "nepali": "ne", "mongolian": "mn",
+    "bosnian": "bs", "kazakh": "kk", "albanian": "sq", "swahili": "sw", "galician": "gl",
+    "marathi": "mr", "punjabi": "pa", "sinhala": "si", "khmer": "km", "shona": "sn",
+    "yoruba": "yo", "somali": "so", "afrikaans": "af", "occitan": "oc", "georgian": "ka",
+    "belarusian": "be", "tajik": "tg", "sindhi": "sd", "gujarati": "gu", "amharic": "am",
+    "yiddish": "yi", "lao": "lo", "uzbek": "uz", "faroese": "fo", "haitian creole": "ht",
+    "pashto": "ps", "turkmen": "tk", "nynorsk": "nn", "maltese": "mt", "sanskrit": "sa",
+    "luxembourgish": "lb", "myanmar": "my", "tibetan": "bo", "tagalog": "tl", "malagasy": "mg",
+    "assamese": "as", "tatar": "tt", "hawaiian": "haw", "lingala": "ln", "hausa": "ha",
+    "bashkir": "ba", "javanese": "jw", "sundanese": "su", "cantonese": "yue",
+}
+
+
+def _language_code(language: str) -> str:
+    """ISO code for a language name ("english" -> "en"); unknown values pass through."""
+    return _LANGUAGE_CODES.get(language.lower(), language)
+
+
+def _transcribe_openai(
+    audio_path: str, model_name: str, progress: Callable[..., None] | None = None
+) -> tuple[str, str, list[dict]]:
+    regions = _speech(audio_path)
+    if regions == []:
+        return "", "", []
+
+    client = _openai_client(
+        settings.openai_api_key,
+        settings.openai_base_url,
+        settings.openai_max_retries,
+        settings.openai_timeout_seconds,
+    )
+    groups = _chunk_groups(audio_path, regions, settings.openai_chunk_seconds)
+    with ThreadPoolExecutor(max_workers=settings.openai_concurrency) as executor:
+        futures = [
+            executor.submit(_transcribe_openai_chunk, client, audio_path, group, model_name)
+            for group in groups
+        ]
+        return _gather(futures, progress)
+
+
+def _transcribe_openai_chunk(
+    client, audio_path: str, regions: list[tuple[int, int]], model_name: str
+) -> tuple[str, str, list[dict]]:
+    samples = np.concatenate([read_wav(audio_path, start, end) for start, end in regions])
+    data = encode_opus(samples, settings.openai_audio_bitrate_kbps)
+    if len(data) > OPENAI_MAX_UPLOAD_BYTES:
+        raise ValueError(
+            f"Encoded chunk is {len(data) / 2**20:.1f} MB, over the OpenAI upload limit; "
+            "lower OPENAI_CHUNK_SECONDS or OPENAI_AUDIO_BITRATE_KBPS"
         )
-    return response.text, ""
+
+    model_name = model_name or "whisper-1"
+    # Only whisper-1 returns timestamps; the gpt-4o transcribe models accept plain json.
+    response = client.audio.transcriptions.create(
+        model=model_name,
+        file=("audio.ogg", data),
+        response_format="verbose_json" if model_name == "whisper-1" else "json",
+    )
+    segments = [
+        {"start": seg.start, "end": seg.end, "text": seg.text}
+        for seg in getattr(response, "segments", None) or []
+    ]
+    result = {"segments": remap_segments(segments, regions, SAMPLE_RATE)}
+    language = getattr(response, "language", None) or ""
+    return response.text.strip(), _language_code(language) if language else "", _segments(result)
@@ -0,0 +1,94 @@
+import hashlib
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.transcription import Transcription
+
+_lock = threading.Lock()
+_counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def fingerprint(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(os.path.join(settings.storage_path, path), "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def lookup(
+    db: Session, audio_fingerprint: str, engine: str, model_name: str | None
+) -> Transcription | None:
+    cached = (
+        db.query(Transcription)
+        .filter(
+            Transcription.audio_fingerprint == audio_fingerprint,
+            Transcription.engine == engine,
+            Transcription.model_name == model_name,
+        )
+        .order_by(Transcription.created_at.desc())
+        .first()
+    )
+    with _lock:
+        _counters["hits" if cached else "misses"] += 1
+    return cached
+
+
+def evict(db: Session):
+    """Drop fingerprints past the TTL or beyond the most recently used entries.
+
+    Every hit stores a new row with the same fingerprint, so the newest row
+    of a fingerprint marks when it was last used.
+    """
+    evicted = 0
+    if settings.transcription_cache_ttl_days:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.transcription_cache_ttl_days)
+        stale = (
+            db.query(Transcription.audio_fingerprint)
+            .filter(Transcription.audio_fingerprint.isnot(None))
+            .group_by(Transcription.audio_fingerprint)
+            .having(func.max(Transcription.created_at) < cutoff)
+            .all()
+        )
+        evicted += _forget(db, [fp for fp, in stale])
+
+    if settings.transcription_cache_max_entries:
+        overflow = (
+            db.query(Transcription.audio_fingerprint)
+            .filter(Transcription.audio_fingerprint.isnot(None))
+            .group_by(Transcription.audio_fingerprint)
+            .order_by(func.max(Transcription.created_at).desc())
+            .offset(settings.transcription_cache_max_entries)
+            .all()
+        )
+        evicted += _forget(db, [fp for fp, in overflow])
+
+    if evicted:
+        db.commit()
+        with _lock:
+            _counters["evictions"] += evicted
+
+
+def _forget(db: Session, fingerprints: list[str]) -> int:
+    if not fingerprints:
+        return 0
+    db.execute(
+        update(Transcription)
+        .where(Transcription.audio_fingerprint.in_(fingerprints))
+        .values(audio_fingerprint=None)
+    )
+    return len(fingerprints)
+
+
+def cache_stats(db: Session) -> dict:
+    entries = (
+        db.query(func.count(func.distinct(Transcription.audio_fingerprint)))
+        .scalar()
+    )
+    with _lock:
+        return {**_counters, "entries": entries}
@@ -0,0 +1,151 @@
+import wave
+
+import numpy as np
+
+from app.config import settings
+from app.services.audio_chunker import FRAME_SECONDS, quietest_point, read_wav
+
+BLOCK_SECONDS = 60
+# Frames whose spectrum is this close to flat are noise (hiss, hum, wind), not voice.
+MAX_FLATNESS = 0.3
+MIN_SPEECH_SECONDS = 0.25
+# Keep the noise floor estimate out of digital silence.
+MIN_FLOOR_DB = -70.0
+# Cap the threshold relative to the loudest frames so non-stop speech is never dropped.
+SPEECH_HEADROOM_DB = 20.0
+# How far before a chunk boundary to look for a pause when splitting a long region.
+SPLIT_SEARCH_SECONDS = 20
+
+
+def _features(samples: np.ndarray, frame: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per-frame energy (dBFS) and spectral flatness."""
+    count = len(samples) // frame
+    frames = samples[: count * frame].reshape(count, frame)
+    energy_db = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+    power = np.abs(np.fft.rfft(frames * np.hanning(frame), axis=1)) ** 2 + 1e-10
+    flatness = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+    return energy_db, flatness
+
+
+def _regions(
+    energy_db: np.ndarray, flatness: np.ndarray, frame: int, total: int, sample_rate: int
+) -> list[tuple[int, int]]:
+    if not len(energy_db):
+        return []
+    floor = max(float(np.percentile(energy_db, 10)), MIN_FLOOR_DB)
+    threshold = min(
+        floor + settings.vad_energy_margin_db,
+        float(np.percentile(energy_db, 95)) - SPEECH_HEADROOM_DB,
+    )
+    speech = (energy_db > threshold) & (flatness < MAX_FLATNESS)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], speech.astype(np.int8), [0]))))
+
+    min_gap = settings.vad_min_silence_seconds * sample_rate / frame
+    runs: list[list[int]] = []
+    for start, end in edges.reshape(-1, 2).tolist():
+        if runs and start - runs[-1][1] < min_gap:
+            runs[-1][1] = end
+        else:
+            runs.append([start, end])
+
+    min_speech = MIN_SPEECH_SECONDS * sample_rate / frame
+    pad = int(settings.vad_padding_seconds * sample_rate)
+    regions: list[tuple[int, int]] = []
+    for start, end in runs:
+        if end - start < min_speech:
+            continue
+        lo = max(0, start * frame - pad)
+        hi = total if end == len(energy_db) else min(total, end * frame + pad)
+        if regions and lo <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], hi)
+        else:
+            regions.append((lo, hi))
+    return regions
+
+
+def speech_regions(samples: np.ndarray, sample_rate: int) -> list[tuple[int, int]]:
+    """Return ``[start, end)`` sample ranges of ``samples`` that contain speech."""
+    frame = int(sample_rate * FRAME_SECONDS)
+    energy_db, flatness = _features(samples, frame)
+    return _regions(energy_db, flatness, frame, len(samples), sample_rate)
+
+
+def detect_speech(audio_path: str) -> list[tuple[int, int]]:
+    """Speech regions of a WAV file, read a block at a time."""
+    with wave.open(audio_path, "rb") as wav:
+        sample_rate = wav.getframerate()
+        total = wav.getnframes()
+
+    frame = int(sample_rate * FRAME_SECONDS)
+    block = frame * int(BLOCK_SECONDS / FRAME_SECONDS)
+    energy, flatness = [], []
+    for start in range(0, total, block):
+        block_energy, block_flatness = _features(read_wav(audio_path, start, start + block), frame)
+        energy.append(block_energy)
+        flatness.append(block_flatness)
+    if not energy:
+        return []
+    return _regions(np.concatenate(energy), np.concatenate(flatness), frame, total, sample_rate)
+
+
+def _split_region(
+    audio_path: str, start: int, end: int, max_samples: int, sample_rate: int
+) -> list[tuple[int, int]]:
+    """Cut a region into pieces of at most ``max_samples`` at the quietest nearby frame."""
+    search = min(int(SPLIT_SEARCH_SECONDS * sample_rate), max_samples // 2)
+    pieces = []
+    while end - start > max_samples:
+        window_start = start + max_samples - search
+        window = read_wav(audio_path, window_start, start + max_samples)
+        cut = window_start + quietest_point(window, sample_rate)
+        pieces.append((start, cut))
+        start = cut
+    pieces.append((start, end))
+    return pieces
+
+
+def group_regions(
+    regions: list[tuple[int, int]], max_samples: int, audio_path: str
+) -> list[list[tuple[int, int]]]:
+    """Pack consecutive regions into groups of at most ``max_samples`` of speech.
+
+    Regions longer than ``max_samples`` (non-stop speech) are split first,
+    at a pause found in the WAV just before each boundary.
+    """
+    with wave.open(audio_path, "rb") as wav:
+        sample_rate = wav.getframerate()
+    pieces = [
+        piece
+        for start, end in regions
+        for piece in _split_region(audio_path, start, end, max_samples, sample_rate)
+    ]
+
+    groups: list[list[tuple[int, int]]] = []
+    size = 0
+    for start, end in pieces:
+        if not groups or size + end - start > max_samples:
+            groups.append([])
+            size = 0
+        groups[-1].append((start, end))
+        size += end - start
+    return groups
+
+
+def remap_segments(
+    segments: list[dict], regions: list[tuple[int, int]], sample_rate: int
+) -> list[dict]:
+    """Move segment times from the concatenated regions back to the original timeline."""
+    lengths = np.cumsum([end - start for start, end in regions])
+
+    def remap(seconds: float, side: str) -> float:
+        position = seconds * sample_rate
+        i = min(int(np.searchsorted(lengths, position, side=side)), len(regions) - 1)
+        before = lengths[i - 1] if i else 0
+        start, end = regions[i]
+        return float(min(start + position - before, end)) / sample_rate
+
+    # A segment ending exactly on a join belongs to the region before it.
+    return [
+        {**seg, "start": remap(seg["start"], "right"), "end": remap(seg["end"], "left")}
+        for seg in segments
+    ]
@@ -0,0 +1,315 @@
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerCrashed(RuntimeError):
+    pass
+
+
+class _Worker:
+    def __init__(self, worker_id: int, process, inbox):
+        self.id = worker_id
+        self.process = process
+        self.inbox = inbox
+        self.task_id: int | None = None
+        self.exiting = False
+        self.models: list[dict] = []
+
+
+class WhisperPool:
+    """Dedicated processes for local Whisper inference.
+
+    Each worker keeps its loaded models between tasks, so the API process
+    never holds model weights or the GIL while decoding, and a worker
+    crash or OOM fails only the task it was running. Workers retire
+    themselves after ``whisper_worker_max_tasks`` tasks or once their RSS
+    passes ``whisper_worker_max_rss_mb`` and are replaced transparently.
+
+    Results and progress travel back over a pipe rather than the database.
+    """
+
+    def __init__(self):
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._workers: dict[int, _Worker] = {}
+        self._pending: deque[tuple[int, Callable, tuple, dict]] = deque()
+        self._futures: dict[int, Future] = {}
+        self._progress: dict[int, Callable[..., None]] = {}
+        self._task_ids = itertools.count(1)
+        self._worker_ids = itertools.count(1)
+        self._preload: set[tuple[str, str]] = set()
+        self._outbox = None
+        self._collector: threading.Thread | None = None
+        self._closed = False
+
+    def size(self) -> int:
+        if settings.whisper_processes > 0:
+            return settings.whisper_processes
+        if settings.transcribe_chunked:
+            return settings.chunk_processes or os.cpu_count() or 1
+        return max(1, settings.transcribe_workers)
+
+    def submit(
+        self, fn: Callable, *args, progress: Callable[..., None] | None = None, **kwargs
+    ) -> Future:
+        """Run ``fn(*args, **kwargs)`` in a worker; ``progress`` receives its reports."""
+        future = Future()
+        with self._lock:
+            self._ensure_started()
+            task_id = next(self._task_ids)
+            self._futures[task_id] = future
+            if progress:
+                self._progress[task_id] = progress
+            self._pending.append((task_id, fn, args, {**kwargs, "progress": bool(progress)}))
+            self._dispatch()
+        return future
+
+    def preload(self, model_name: str, engine: str = "whisper_local"):
+        """Load ``model_name`` in every worker, and in every worker started later."""
+        with self._lock:
+            self._preload.add((engine, model_name))
+            self._ensure_started()
+            for worker in self._workers.values():
+                worker.inbox.put(("preload", engine, model_name))
+
+    def loaded(self) -> list[dict]:
+        with self._lock:
+            return [
+                {**model, "worker_pid": worker.process.pid}
+                for worker in self._workers.values()
+                for model in worker.models
+            ]
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers.values())
+            self._workers.clear()
+            collector = self._collector
+        for worker in workers:
+            worker.inbox.put(None)
+        for worker in workers:
+            worker.process.join(timeout=10)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        if collector:
+            collector.join(timeout=5)
+        with self._lock:
+            for future in self._futures.values():
+                future.set_exception(WorkerCrashed("Whisper pool closed"))
+            self._futures.clear()
+            self._progress.clear()
+            self._pending.clear()
+            self._outbox = None
+            self._collector = None
+            self._closed = False
+
+    def _ensure_started(self):
+        if self._closed:
+            raise RuntimeError("Whisper pool is closed")
+        if self._outbox is None:
+            self._outbox = self._ctx.Queue()
+            self._collector = threading.Thread(
+                target=self._collect, name="whisper-pool", daemon=True
+            )
+            self._collector.start()
+        while len(self._workers) < self.size():
+            self._spawn()
+
+    def _spawn(self):
+        worker_id = next(self._worker_ids)
+        inbox = self._ctx.Queue()
+        # Split the cores between workers instead of letting each torch grab all of them.
+        threads = max(1, (os.cpu_count() or 1) // self.size())
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                worker_id,
+                inbox,
+                self._outbox,
+                sorted(self._preload),
+                threads,
+                settings.whisper_worker_max_tasks,
+                settings.whisper_worker_max_rss_mb,
+            ),
+            name=f"whisper-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        self._workers[worker_id] = _Worker(worker_id, process, inbox)
+
+    def _dispatch(self):
+        for worker in self._workers.values():
+            if not self._pending:
+                return
+            if worker.task_id is None and not worker.exiting and worker.process.is_alive():
+                task = self._pending.popleft()
+                worker.task_id = task[0]
+                worker.inbox.put(("task", *task))
+
+    def _collect(self):
+        last_check = time.monotonic()
+        while True:
+            try:
+                message = self._outbox.get(timeout=1.0)
+            except queue.Empty:
+                message = None
+            except (EOFError, OSError):
+                return
+            with self._lock:
+                if message:
+                    self._handle(*message)
+                if time.monotonic() - last_check >= 1.0:
+                    self._reap()
+                    last_check = time.monotonic()
+                if self._closed:
+                    return
+
+    def _handle(self, kind: str, worker_id: int, *payload):
+        worker = self._workers.get(worker_id)
+        if kind == "progress":
+            task_id, data = payload
+            callback = self._progress.get(task_id)
+            if callback:
+                try:
+                    callback(**data)
+                except Exception:
+                    logger.exception("Progress callback failed")
+        elif kind in ("result", "error"):
+            task_id, value = payload
+            future = self._futures.pop(task_id, None)
+            self._progress.pop(task_id, None)
+            if worker:
+                worker.task_id = None
+            if future:
+                if kind == "result":
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+            self._dispatch()
+        elif kind == "models" and worker:
+            worker.models = payload[0]
+        elif kind == "retiring" and worker:
+            worker.exiting = True
+            logger.info("Recycling whisper worker %s: %s", worker.process.pid, payload[0])
+
+    def _reap(self):
+        dead = [w for w in self._workers.values() if not w.process.is_alive()]
+        # A recycled worker posts its last result just before exiting; read
+        # it before deciding the worker took its task down with it.
+        if any(worker.task_id is not None for worker in dead):
+            self._drain()
+        for worker in dead:
+            worker.process.join()
+            del self._workers[worker.id]
+            if worker.task_id is not None:
+                future = self._futures.pop(worker.task_id, None)
+                self._progress.pop(worker.task_id, None)
+                if future:
+                    future.set_exception(
+                        WorkerCrashed(
+                            f"Whisper worker exited unexpectedly "
+                            f"(exit code {worker.process.exitcode})"
+                        )
+                    )
+            elif not worker.exiting:
+                logger.warning(
+                    "Whisper worker %s exited (exit code %s)",
+                    worker.process.pid,
+                    worker.process.exitcode,
+                )
+        if not self._closed:
+            while len(self._workers) < self.size():
+                self._spawn()
+            self._dispatch()
+
+    def _drain(self):
+        while True:
+            try:
+                message = self._outbox.get_nowait()
+            except (queue.Empty, EOFError, OSError):
+                return
+            self._handle(*message)
+
+
+def _worker_main(
+    worker_id: int,
+    inbox,
+    outbox,
+    preload: list[tuple[str, str]],
+    threads: int,
+    max_tasks: int,
+    max_rss_mb: int,
+):
+    try:
+        import torch
+
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    from app.services.model_registry import model_registry, rss_mb
+
+    model_registry.threads = threads
+
+    def preload_model(engine: str, name: str):
+        try:
+            model_registry.preload(name, engine)
+        except Exception:
+            logger.exception("Failed to preload %s model %s", engine, name)
+        outbox.put(("models", worker_id, model_registry.loaded()))
+
+    for engine, name in preload:
+        preload_model(engine, name)
+
+    tasks_done = 0
+    while True:
+        message = inbox.get()
+        if message is None:
+            return
+        if message[0] == "preload":
+            preload_model(*message[1:])
+            continue
+
+        _, task_id, fn, args, kwargs = message
+        if kwargs.pop("progress"):
+            kwargs["progress"] = lambda **data: outbox.put(
+                ("progress", worker_id, task_id, data)
+            )
+        try:
+            reply = ("result", worker_id, task_id, fn(*args, **kwargs))
+        except Exception as e:
+            try:
+                pickle.dumps(e)
+            except Exception:
+                e = RuntimeError(f"{type(e).__name__}: {e}")
+            reply = ("error", worker_id, task_id, e)
+        outbox.put(("models", worker_id, model_registry.loaded()))
+
+        tasks_done += 1
+        reason = None
+        if max_tasks and tasks_done >= max_tasks:
+            reason = f"{tasks_done} tasks"
+        elif max_rss_mb and rss_mb() > max_rss_mb:
+            reason = f"RSS above {max_rss_mb} MB"
+        # Announce retirement before the result so no new task is sent our way.
+        if reason:
+            outbox.put(("retiring", worker_id, reason))
+        outbox.put(reply)
+        if reason:
+            return
+
+
+whisper_pool = WhisperPool()
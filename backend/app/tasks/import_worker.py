@@ -0,0 +1,115 @@
+import logging
+import threading
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.video_import import VideoImport
+from app.services.importer import expand_urls, stage_import
+from app.tasks.queue import notify
+
+logger = logging.getLogger(__name__)
+
+# A video added concurrently under the same canonical key fails the staging
+# insert; the next attempt links it instead.
+STAGE_ATTEMPTS = 3
+
+_wake = threading.Event()
+_stop = threading.Event()
+_thread: threading.Thread | None = None
+
+
+def wake():
+    _wake.set()
+
+
+def start():
+    global _thread
+    _stop.clear()
+    db = SessionLocal()
+    try:
+        # Expansion has no side effects until staging commits; start over.
+        db.execute(
+            update(VideoImport)
+            .where(VideoImport.status == "expanding")
+            .values(status="pending")
+        )
+        db.commit()
+    finally:
+        db.close()
+    _thread = threading.Thread(target=_run, name="import-worker", daemon=True)
+    _thread.start()
+
+
+def stop():
+    _stop.set()
+    _wake.set()
+
+
+def _run():
+    while not _stop.is_set():
+        _wake.clear()
+        import_id = _claim_next()
+        if import_id is None:
+            _wake.wait(timeout=settings.queue_poll_interval)
+            continue
+        _expand(import_id)
+
+
+def _claim_next() -> str | None:
+    db = SessionLocal()
+    try:
+        while True:
+            import_id = (
+                db.query(VideoImport.id)
+                .filter(VideoImport.status == "pending")
+                .order_by(VideoImport.created_at)
+                .limit(1)
+                .scalar()
+            )
+            if import_id is None:
+                return None
+            claimed = db.execute(
+                update(VideoImport)
+                .where(VideoImport.id == import_id, VideoImport.status == "pending")
+                .values(status="expanding")
+            )
+            db.commit()
+            if claimed.rowcount == 1:
+                return import_id
+    finally:
+        db.close()
+
+
+def _expand(import_id: str):
+    db = SessionLocal()
+    try:
+        video_import = db.get(VideoImport, import_id)
+        urls = video_import.source_urls
+        db.commit()
+
+        expanded = expand_urls(urls)
+        for attempt in range(1, STAGE_ATTEMPTS + 1):
+            try:
+                stage_import(db, video_import, expanded)
+                db.commit()
+                break
+            except IntegrityError:
+                db.rollback()
+                if attempt == STAGE_ATTEMPTS:
+                    raise
+    except Exception as e:
+        db.rollback()
+        logger.exception("Import %s failed", import_id)
+        db.execute(
+            update(VideoImport)
+            .where(VideoImport.id == import_id)
+            .values(status="failed", error_message=f"{type(e).__name__}: {e}")
+        )
+        db.commit()
+        return
+    finally:
+        db.close()
+    notify()
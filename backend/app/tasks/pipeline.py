@@ -1,92 +1,241 @@
 import uuid
 import traceback
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import SessionLocal
 from app.models.video import Video
-from app.models.transcription import Transcription
+from app.models.transcription import Transcription, TranscriptSegment
 from app.services.downloader import download_video
 from app.services.audio_extractor import extract_audio
 from app.services.transcriber import transcribe_audio
 from app.services.markdown_writer import write_markdown
+from app.services import model_policy, transcription_cache
+from app.services.events import progress_reporter
+from app.services.search_index import index_video
+from app.tasks.video_writer import video_writer
 
+STAGES = ("download", "extract", "transcribe")
 
-def process_video(video_id: str, engine: str | None = None, model_name: str | None = None):
+
+def stage_for_status(status: str) -> str | None:
+    if status in ("pending", "failed"):
+        return "download"
+    if status == "downloaded":
+        return "extract"
+    if status == "extracted":
+        return "transcribe"
+    return None
+
+
+def run_stage(
+    stage: str, video_id: str, engine: str | None = None, model_name: str | None = None
+) -> str | None:
+    """Run a single pipeline stage and return the stage that should follow it."""
     db = SessionLocal()
     try:
-        _run_pipeline(db, video_id, engine, model_name)
-    except Exception as e:
         video = db.query(Video).filter(Video.id == video_id).first()
-        if video:
-            video.status = "failed"
-            video.error_message = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
-            db.commit()
+        if not video or stage_for_status(video.status) != stage:
+            return None
+        _STAGE_HANDLERS[stage](db, video, engine, model_name)
+        db.expire(video)
+        return stage_for_status(video.status)
+    except Exception as e:
+        db.rollback()
+        video_writer.update(
+            video_id,
+            wait=True,
+            status="failed",
+            error_message=f"{type(e).__name__}: {e}\n{traceback.format_exc()}",
+        )
+        return None
     finally:
         db.close()
 
 
-def _run_pipeline(db: Session, video_id: str, engine: str | None, model_name: str | None):
-    video = db.query(Video).filter(Video.id == video_id).first()
-    if not video:
+# Stage handlers never commit Video changes through their own session: every
+# status transition goes through video_writer so updates stay ordered and
+# batched. Long-running work happens outside any open transaction.
+
+
+def _download(db: Session, video: Video, engine: str | None, model_name: str | None):
+    video_writer.update(video.id, status="downloading", error_message=None)
+    mode = video.download_mode or settings.download_mode
+    db.commit()
+
+    # An explicitly requested engine means the captions were not wanted.
+    policy = None
+    if engine is None and settings.subtitles_policy != "off":
+        policy = settings.subtitles_policy
+    info = download_video(
+        video.id,
+        video.url,
+        mode=mode,
+        progress=progress_reporter(video.id, "download"),
+        subtitles_policy=policy,
+    )
+    fields = {
+        "title": info["title"],
+        "description": info["description"],
+        "duration_seconds": info["duration_seconds"],
+        "thumbnail_url": info["thumbnail_url"],
+        "channel_name": info["channel_name"],
+        "video_path": info["video_path"],
+        "status": "downloaded",
+    }
+    if info.get("canonical_key") and info["canonical_key"] != video.canonical_key:
+        taken = db.query(Video.id).filter(Video.canonical_key == info["canonical_key"]).first()
+        if not taken:
+            fields["canonical_key"] = info["canonical_key"]
+    captions = info.get("subtitles")
+    if captions:
+        # Skip extract and transcribe; Whisper stays available via /transcribe.
+        fields["status"] = "transcribing"
+    db.commit()
+    video_writer.update(video.id, wait=True, **fields)
+
+    if captions:
+        db.expire(video)
+        _save_transcription(db, video, _subtitles_result(captions), None)
+        return
+
+    index_video(db, video.id)
+    db.commit()
+
+
+def _extract(db: Session, video: Video, engine: str | None, model_name: str | None):
+    # Local engines can decode the media straight from an ffmpeg pipe; the
+    # OpenAI API still needs a file to upload.
+    if settings.audio_streaming and (engine or settings.whisper_engine) != "openai_api":
+        video_writer.update(video.id, wait=True, status="extracted")
         return
 
-    # Step 1: Download
-    if video.status in ("pending", "failed"):
-        video.status = "downloading"
-        video.error_message = None
-        db.commit()
-
-        info = download_video(video_id, video.url, db)
-        video.title = info["title"]
-        video.description = info["description"]
-        video.duration_seconds = info["duration_seconds"]
-        video.thumbnail_url = info["thumbnail_url"]
-        video.channel_name = info["channel_name"]
-        video.video_path = info["video_path"]
-        video.status = "downloaded"
-        db.commit()
-
-    # Step 2: Extract audio
-    if video.status == "downloaded":
-        video.status = "extracting"
-        db.commit()
-
-        audio_path = extract_audio(video_id, video.video_path)
-        video.audio_path = audio_path
-        video.status = "extracted"
-        db.commit()
-
-    # Step 3: Transcribe
-    if video.status == "extracted":
-        video.status = "transcribing"
-        db.commit()
-
-        result = transcribe_audio(video.audio_path, engine, model_name)
-
-        md_path = write_markdown(
-            video_id=video_id,
-            title=video.title,
-            url=video.url,
-            channel=video.channel_name,
-            duration_seconds=video.duration_seconds,
-            engine=result["engine"],
-            model_name=result["model_name"],
-            text=result["raw_text"],
+    video_writer.update(video.id, status="extracting")
+    video_path, duration = video.video_path, video.duration_seconds
+    db.commit()
+
+    audio_path = extract_audio(
+        video.id, video_path, progress=progress_reporter(video.id, "extract"), duration=duration
+    )
+    video_writer.update(video.id, wait=True, audio_path=audio_path, status="extracted")
+
+
+def _transcribe(db: Session, video: Video, engine: str | None, model_name: str | None):
+    video_writer.update(video.id, status="transcribing")
+
+    engine = engine or settings.whisper_engine
+    model_name = model_name or model_policy.choose_model(db, engine, video.duration_seconds)
+
+    audio_fingerprint = None
+    cached = None
+    if settings.transcription_cache:
+        audio_fingerprint = transcription_cache.fingerprint(video.audio_path or video.video_path)
+        cached = transcription_cache.lookup(db, audio_fingerprint, engine, model_name)
+
+    result = _cached_result(cached) if cached else None
+
+    # Release the read transaction before the (possibly hours-long) transcription.
+    audio_path, media_path = video.audio_path, video.video_path
+    media_seconds = video.duration_seconds
+    db.commit()
+
+    if result is None:
+        result = transcribe_audio(
+            audio_path,
+            engine,
+            model_name,
+            media_path=media_path,
+            progress=progress_reporter(video.id, "transcribe"),
+            media_seconds=media_seconds,
         )
 
-        transcription = Transcription(
-            id=str(uuid.uuid4()),
-            video_id=video_id,
-            engine=result["engine"],
-            model_name=result["model_name"],
-            language=result["language"],
-            raw_text=result["raw_text"],
-            markdown_path=md_path,
-            duration_seconds=result["duration_seconds"],
+    _save_transcription(db, video, result, audio_fingerprint)
+
+    if audio_fingerprint and not cached:
+        transcription_cache.evict(db)
+
+
+def _save_transcription(
+    db: Session, video: Video, result: dict, audio_fingerprint: str | None
+):
+    md_path = write_markdown(
+        video_id=video.id,
+        title=video.title,
+        url=video.url,
+        channel=video.channel_name,
+        duration_seconds=video.duration_seconds,
+        engine=result["engine"],
+        model_name=result["model_name"],
+        text=result["raw_text"],
+    )
+
+    transcription = Transcription(
+        id=str(uuid.uuid4()),
+        video_id=video.id,
+        engine=result["engine"],
+        model_name=result["model_name"],
+        language=result["language"],
+        raw_text=result["raw_text"],
+        markdown_path=md_path,
+        audio_fingerprint=audio_fingerprint,
+        duration_seconds=result["duration_seconds"],
+        real_time_factor=result["real_time_factor"],
+    )
+    db.add(transcription)
+    db.flush()
+    if result["segments"]:
+        db.execute(
+            insert(TranscriptSegment),
+            [
+                {
+                    "transcription_id": transcription.id,
+                    "position": i,
+                    "start_seconds": seg["start"],
+                    "end_seconds": seg["end"],
+                    "text": seg["text"],
+                }
+                for i, seg in enumerate(result["segments"])
+            ],
         )
-        db.add(transcription)
 
-        video.transcription_path = md_path
-        video.status = "completed"
-        db.commit()
+    db.commit()
+    video_writer.update(video.id, wait=True, transcription_path=md_path, status="completed")
+
+    index_video(db, video.id)
+    db.commit()
+
+
+def _subtitles_result(captions: dict) -> dict:
+    return {
+        "engine": "platform_subtitles",
+        "model_name": captions["kind"],
+        "language": captions["language"],
+        "raw_text": " ".join(seg["text"] for seg in captions["segments"]),
+        "segments": captions["segments"],
+        "duration_seconds": 0,
+        "real_time_factor": None,
+    }
+
+
+def _cached_result(cached: Transcription) -> dict:
+    return {
+        "engine": cached.engine,
+        "model_name": cached.model_name,
+        "language": cached.language,
+        "raw_text": cached.raw_text,
+        "segments": [
+            {"start": s.start_seconds, "end": s.end_seconds, "text": s.text}
+            for s in cached.segments
+        ],
+        "duration_seconds": 0,
+        "real_time_factor": None,
+    }
+
+
+_STAGE_HANDLERS = {
+    "download": _download,
+    "extract": _extract,
+    "transcribe": _transcribe,
+}
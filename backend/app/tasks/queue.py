@@ -0,0 +1,327 @@
+import logging
+import threading
+from datetime import datetime, timezone
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.job import Job
+from app.models.video import Video
+from app.services import model_policy
+from app.tasks.pipeline import STAGES, run_stage, stage_for_status
+from app.tasks.video_writer import video_writer
+
+logger = logging.getLogger(__name__)
+
+# Status a video is rolled back to when the process died mid-stage.
+_RESUME_STATUS = {
+    "downloading": "pending",
+    "extracting": "downloaded",
+    "transcribing": "extracted",
+}
+
+_cond = threading.Condition()
+_stop = threading.Event()
+_workers: dict[str, list[threading.Thread]] = {}
+
+
+def stage_concurrency(stage: str) -> int:
+    return max(1, getattr(settings, f"{stage}_workers"))
+
+
+def is_running(db: Session, video_id: str) -> bool:
+    return (
+        db.query(Job.id).filter(Job.video_id == video_id, Job.status == "running").first()
+        is not None
+    )
+
+
+def enqueue(
+    db: Session,
+    video_id: str,
+    engine: str | None = None,
+    model_name: str | None = None,
+    commit: bool = True,
+    stage: str | None = None,
+    priority: int = 0,
+) -> Job | None:
+    if stage is None:
+        video = db.query(Video).filter(Video.id == video_id).first()
+        stage = stage_for_status(video.status) if video else None
+        if stage is None:
+            return None
+
+    # The running stage hands the video on itself; a second job would race it.
+    if is_running(db, video_id):
+        return None
+
+    job = (
+        db.query(Job)
+        .filter(Job.video_id == video_id, Job.status == "queued")
+        .first()
+    )
+    if job:
+        job.stage = stage
+        job.engine = engine
+        job.model_name = model_name
+        job.priority = priority
+    else:
+        job = Job(
+            video_id=video_id,
+            stage=stage,
+            engine=engine,
+            model_name=model_name,
+            priority=priority,
+        )
+        db.add(job)
+
+    if commit:
+        db.commit()
+        notify()
+    return job
+
+
+def enqueue_many(db: Session, video_ids: list[str], stage: str = "download"):
+    """Queue ``stage`` for videos created in this transaction; they have no job yet."""
+    db.add_all(Job(video_id=video_id, stage=stage) for video_id in video_ids)
+
+
+def notify():
+    with _cond:
+        _cond.notify_all()
+
+
+def queue_stats(db: Session) -> dict:
+    rows = (
+        db.query(Job.stage, Job.status, func.count(Job.id))
+        .group_by(Job.stage, Job.status)
+        .all()
+    )
+    stages = {
+        stage: {
+            "queued": 0,
+            "running": 0,
+            "done": 0,
+            "failed": 0,
+            "workers": stage_concurrency(stage),
+        }
+        for stage in STAGES
+    }
+    for stage, status, count in rows:
+        if stage in stages:
+            stages[stage][status] = count
+
+    return {
+        "queued": sum(s["queued"] for s in stages.values()),
+        "running": sum(s["running"] for s in stages.values()),
+        "stages": stages,
+    }
+
+
+def recover_jobs():
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(Job)
+            .where(Job.status == "running")
+            .values(status="queued", started_at=None)
+        )
+
+        stuck = db.query(Video).filter(Video.status.in_(list(_RESUME_STATUS))).all()
+        for video in stuck:
+            status = _RESUME_STATUS[video.status]
+            # The subtitle fast path goes to "transcribing" straight from a
+            # download, with no media on disk; only a new download can resume it.
+            if not video.video_path and not video.audio_path:
+                status = "pending"
+            video.status = status
+            stage = stage_for_status(status)
+
+            # The interrupted job was requeued above, keeping its engine, model
+            # and priority; it must resume at the stage matching the status.
+            jobs = db.query(Job).filter(Job.video_id == video.id, Job.status == "queued").all()
+            for job in jobs:
+                job.stage = stage
+            if not jobs:
+                enqueue(db, video.id, commit=False, stage=stage)
+
+        db.commit()
+    finally:
+        db.close()
+
+
+def start_workers():
+    _stop.clear()
+    recover_jobs()
+    for stage in STAGES:
+        _workers[stage] = []
+        for i in range(stage_concurrency(stage)):
+            worker = threading.Thread(
+                target=_worker_loop, args=(stage,), name=f"{stage}-worker-{i}", daemon=True
+            )
+            worker.start()
+            _workers[stage].append(worker)
+    if settings.model_upgrade_idle:
+        upgrader = threading.Thread(target=_upgrade_loop, name="model-upgrader", daemon=True)
+        upgrader.start()
+        _workers["upgrade"] = [upgrader]
+
+
+def stop_workers():
+    _stop.set()
+    notify()
+    _workers.clear()
+
+
+def _worker_loop(stage: str):
+    while not _stop.is_set():
+        job = _claim_next(stage)
+        if job is None:
+            with _cond:
+                _cond.wait(timeout=settings.queue_poll_interval)
+            continue
+        _run_job(stage, *job)
+
+
+def _upgrade_loop():
+    while not _stop.wait(settings.model_upgrade_interval):
+        try:
+            _enqueue_upgrade()
+        except Exception:
+            logger.exception("Model upgrade check failed")
+
+
+def _enqueue_upgrade():
+    """Queue one re-transcription with ``whisper_model`` once the queue is idle."""
+    db = SessionLocal()
+    try:
+        busy = db.query(Job.id).filter(Job.status.in_(("queued", "running"))).first()
+        if busy or not model_policy.adaptive():
+            return
+        transcription = model_policy.upgrade_candidate(db)
+        if not transcription:
+            return
+
+        video_id, engine, fast_model = (
+            transcription.video_id, transcription.engine, transcription.model_name
+        )
+        status = "extracted" if transcription.video.audio_path else "downloaded"
+        db.commit()
+
+        # Set the status before the job exists, so no worker claims it against "completed".
+        video_writer.update(video_id, wait=True, status=status)
+        enqueue(
+            db,
+            video_id,
+            engine,
+            settings.whisper_model,
+            commit=False,
+            stage=stage_for_status(status),
+            priority=model_policy.UPGRADE_PRIORITY,
+        )
+        db.commit()
+        logger.info(
+            "Upgrading transcript of %s from %s to %s", video_id, fast_model, settings.whisper_model
+        )
+    finally:
+        db.close()
+    notify()
+
+
+def _claim_next(stage: str) -> tuple[str, str, str | None, str | None, int] | None:
+    # While videos added on their own are waiting, imports hold at most
+    # import_concurrency slots per stage so a large import never starves
+    # them; otherwise an import may use every idle worker.
+    others_waiting = (
+        select(Job.id)
+        .join(Video, Video.id == Job.video_id)
+        .where(Job.stage == stage, Job.status == "queued", Video.import_id.is_(None))
+        .exists()
+    )
+    busy_imports = (
+        select(Video.import_id)
+        .join(Job, Job.video_id == Video.id)
+        .where(Job.stage == stage, Job.status == "running", Video.import_id.is_not(None))
+        .group_by(Video.import_id)
+        .having(func.count(Job.id) >= max(1, settings.import_concurrency))
+    )
+    db = SessionLocal()
+    try:
+        while True:
+            job = (
+                db.query(Job)
+                .join(Video, Video.id == Job.video_id)
+                .filter(
+                    Job.stage == stage,
+                    Job.status == "queued",
+                    or_(
+                        Video.import_id.is_(None),
+                        ~others_waiting,
+                        Video.import_id.not_in(busy_imports),
+                    ),
+                )
+                .order_by(Job.priority.desc(), Job.created_at)
+                .first()
+            )
+            if not job:
+                return None
+
+            # Conditional update so two workers never claim the same job.
+            claimed = db.execute(
+                update(Job)
+                .where(Job.id == job.id, Job.status == "queued")
+                .values(
+                    status="running",
+                    attempts=Job.attempts + 1,
+                    started_at=datetime.now(timezone.utc),
+                )
+            )
+            db.commit()
+            if claimed.rowcount == 1:
+                return job.id, job.video_id, job.engine, job.model_name, job.priority
+    finally:
+        db.close()
+
+
+def _run_job(
+    stage: str,
+    job_id: str,
+    video_id: str,
+    engine: str | None,
+    model_name: str | None,
+    priority: int,
+):
+    next_stage = run_stage(stage, video_id, engine, model_name)
+
+    restore = False
+    db = SessionLocal()
+    try:
+        video = db.query(Video).filter(Video.id == video_id).first()
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            return
+        if video and video.status == "failed":
+            job.status = "failed"
+            job.error_message = video.error_message
+            # A failed upgrade leaves the fast transcript in place; the video stays usable.
+            restore = priority == model_policy.UPGRADE_PRIORITY
+        else:
+            job.status = "done"
+        job.finished_at = datetime.now(timezone.utc)
+        db.flush()
+
+        # Hand the video to the next stage's pool, keeping the requested engine/model.
+        if video and next_stage:
+            enqueue(
+                db, video_id, engine, model_name, commit=False, stage=next_stage, priority=priority
+            )
+        db.commit()
+    finally:
+        db.close()
+
+    if restore:
+        video_writer.update(video_id, wait=True, status="completed", error_message=None)
+    if next_stage:
+        notify()
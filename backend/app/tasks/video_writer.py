@@ -0,0 +1,100 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.video import Video
+
+logger = logging.getLogger(__name__)
+
+
+class VideoWriter:
+    """Single writer thread for the pipeline's frequent ``Video`` field updates.
+
+    Updates for the same video are merged in submission order and every
+    batch is committed in one transaction, so pipeline threads never
+    contend with each other for SQLite's write lock. If that transaction
+    fails, each video is retried on its own so one bad update only fails
+    its own waiters.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending: dict[str, dict] = {}
+        self._waiters: dict[str, list[Future]] = {}
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+
+    def update(self, video_id: str, wait: bool = False, **fields):
+        """Queue ``fields`` for ``video_id``; with ``wait`` block until committed."""
+        future = Future() if wait else None
+        with self._cond:
+            self._ensure_started()
+            self._pending.setdefault(video_id, {}).update(fields)
+            if future:
+                self._waiters.setdefault(video_id, []).append(future)
+            self._cond.notify()
+        if future:
+            future.result()
+
+    def close(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="video-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+            # Give concurrent updates a moment to land in the same batch; a
+            # plain sleep, since every update() notifies the condition.
+            time.sleep(settings.db_write_batch_ms / 1000)
+            with self._cond:
+                batch, self._pending = self._pending, {}
+                waiters, self._waiters = self._waiters, {}
+
+            error = self._apply(batch)
+            if error and len(batch) > 1:
+                errors = {video_id: self._apply({video_id: fields}) for video_id, fields in batch.items()}
+            else:
+                errors = dict.fromkeys(batch, error)
+            for video_id, futures in waiters.items():
+                error = errors.get(video_id)
+                for future in futures:
+                    if error:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(None)
+
+    def _apply(self, batch: dict[str, dict]) -> Exception | None:
+        db = SessionLocal()
+        try:
+            videos = db.query(Video).filter(Video.id.in_(list(batch))).all()
+            for video in videos:
+                for field, value in batch[video.id].items():
+                    setattr(video, field, value)
+            db.commit()
+            return None
+        except Exception as e:
+            db.rollback()
+            logger.exception("Failed to apply video updates for %s", list(batch))
+            return e
+        finally:
+            db.close()
+
+
+video_writer = VideoWriter()
@@ -0,0 +1,68 @@
+"""Real-time factor of the local engines on the same audio.
+
+Run from backend/: python -m benchmarks.bench_engines path/to/audio.wav [model] [threads]
+
+The audio must be a 16 kHz mono WAV, as produced by the extract stage.
+Engines whose package is not installed are skipped.
+"""
+import difflib
+import os
+import sys
+import time
+
+from app.services.audio_chunker import wav_duration
+from app.services.model_registry import LOADERS, rss_mb
+from app.services.transcriber import LOCAL_ENGINES, _run_model
+
+
+def _words(text: str) -> list[str]:
+    return [w.strip(".,!?;:").lower() for w in text.split() if w.strip(".,!?;:")]
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    audio_path = sys.argv[1]
+    model_name = sys.argv[2] if len(sys.argv) > 2 else "base"
+    threads = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+    audio_seconds = wav_duration(audio_path)
+    print(f"{audio_path}: {audio_seconds:.1f}s, model {model_name}, {threads} threads")
+
+    try:
+        import torch
+
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+    print(f"{'engine':>15} {'load s':>7} {'run s':>8} {'RTF':>6} {'x realtime':>11} {'RSS MB':>7} {'segs':>5} {'vs first':>9}")
+    reference = None
+    for engine in LOCAL_ENGINES:
+        before = rss_mb()
+        start = time.perf_counter()
+        try:
+            model = LOADERS[engine](model_name, threads)
+        except ImportError as e:
+            print(f"{engine:>15} skipped ({e.name} not installed)")
+            continue
+        load_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = _run_model(model, engine, audio_path)
+        run_s = time.perf_counter() - start
+        rtf = run_s / audio_seconds
+
+        words = _words(result["text"])
+        if reference is None:
+            reference, similarity = words, "-"
+        else:
+            similarity = f"{difflib.SequenceMatcher(None, reference, words).ratio():.3f}"
+        print(
+            f"{engine:>15} {load_s:>7.1f} {run_s:>8.1f} {rtf:>6.3f} {1 / rtf:>10.1f}x "
+            f"{rss_mb() - before:>7.0f} {len(result['segments']):>5} {similarity:>9}"
+        )
+        del model
+
+
+if __name__ == "__main__":
+    main()
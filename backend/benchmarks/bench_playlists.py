@@ -0,0 +1,93 @@
+"""Playlist read/reorder latency and query count as the playlist grows.
+
+Run from backend/: python -m benchmarks.bench_playlists
+"""
+import asyncio
+import inspect
+import os
+import statistics
+import tempfile
+import time
+from functools import partial
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+os.environ["STORAGE_PATH"] = _tmp
+
+from sqlalchemy import event  # noqa: E402
+
+from app.database import AsyncSessionLocal, Base, SessionLocal, async_engine, engine  # noqa: E402
+from app.models import Playlist, Video  # noqa: E402
+from app.routers.playlists import get_playlist, list_playlists, reorder_playlist_videos  # noqa: E402
+from app.schemas.playlist import PlaylistReorder  # noqa: E402
+from app.services import playlists as playlist_service  # noqa: E402
+
+SIZES = (10, 100, 300, 1000)
+RUNS = 20
+
+_queries = 0
+
+
+@event.listens_for(engine, "before_cursor_execute")
+@event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+def _count(*args):
+    global _queries
+    _queries += 1
+
+
+def _measure(fn) -> tuple[float, int]:
+    if inspect.iscoroutinefunction(fn):
+        return asyncio.run(_measure_async(fn))
+    global _queries
+    timings = []
+    for _ in range(RUNS):
+        db = SessionLocal()
+        _queries = 0
+        start = time.perf_counter()
+        fn(db)
+        timings.append(time.perf_counter() - start)
+        queries = _queries
+        db.close()
+    return statistics.median(timings) * 1000, queries
+
+
+async def _measure_async(fn) -> tuple[float, int]:
+    global _queries
+    timings = []
+    for _ in range(RUNS):
+        async with AsyncSessionLocal() as db:
+            _queries = 0
+            start = time.perf_counter()
+            await fn(db)
+            timings.append(time.perf_counter() - start)
+            queries = _queries
+    await async_engine.dispose()
+    return statistics.median(timings) * 1000, queries
+
+
+def main():
+    Base.metadata.create_all(bind=engine)
+    print(f"{'videos':>7} {'get ms':>8} {'get q':>6} {'list ms':>8} {'list q':>7} {'reorder ms':>11} {'reorder q':>10}")
+    for size in SIZES:
+        db = SessionLocal()
+        playlist = Playlist(name=f"bench {size}")
+        db.add(playlist)
+        videos = [Video(url=f"https://example.com/{size}/{i}", title=f"Aula {i}") for i in range(size)]
+        db.add_all(videos)
+        db.flush()
+        playlist_service.add_videos(db, playlist.id, [v.id for v in videos])
+        db.commit()
+        playlist_id = playlist.id
+        reversed_ids = [v.id for v in reversed(videos)]
+        db.close()
+
+        get_ms, get_q = _measure(partial(get_playlist, playlist_id))
+        list_ms, list_q = _measure(list_playlists)
+        reorder_ms, reorder_q = _measure(
+            lambda db: reorder_playlist_videos(playlist_id, PlaylistReorder(video_ids=reversed_ids), db)
+        )
+        print(f"{size:>7} {get_ms:>8.2f} {get_q:>6} {list_ms:>8.2f} {list_q:>7} {reorder_ms:>11.2f} {reorder_q:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+
+# Settings are read at import time, so point them at a scratch directory
+# before anything from the app is imported.
+_scratch = tempfile.mkdtemp(prefix="study-tests-")
+os.makedirs(os.path.join(_scratch, "db"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_scratch}/db/test.db"
+os.environ["STORAGE_PATH"] = _scratch
+os.environ["WHISPER_PRELOAD"] = "false"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app import main  # noqa: E402
+from app.database import Base, SessionLocal, engine, run_migrations  # noqa: E402
+from app.services.credential_index import credential_index  # noqa: E402
+from app.tasks import import_worker  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema():
+    Base.metadata.create_all(bind=engine)
+    run_migrations()
+
+
+@pytest.fixture(autouse=True)
+def clean_tables(schema):
+    yield
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+        conn.execute(text("DELETE FROM video_search"))
+    credential_index.invalidate()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Only the API: no pipeline or import workers picking up what tests create.
+    monkeypatch.setattr(main, "start_workers", lambda: None)
+    monkeypatch.setattr(main, "stop_workers", lambda: None)
+    monkeypatch.setattr(import_worker, "start", lambda: None)
+    monkeypatch.setattr(import_worker, "stop", lambda: None)
+    with TestClient(main.app) as client:
+        yield client
@@ -0,0 +1,42 @@
+import pytest
+
+from app.services.canonical_url import canonical_key, normalize_url
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtube.com/watch?v=dQw4w9WgXcQ&t=42s&si=abc",
+        "https://m.youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?si=tracking",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL123&index=3",
+    ],
+)
+def test_youtube_variants_share_a_key(url):
+    assert canonical_key(url) == "Youtube:dQw4w9WgXcQ"
+
+
+def test_normalize_url_drops_tracking_and_sorts_params():
+    assert (
+        normalize_url("HTTPS://www.Example.com/path/?utm_source=x&b=2&a=1&fbclid=y")
+        == "https://example.com/path?a=1&b=2"
+    )
+
+
+def test_unknown_site_falls_back_to_normalized_url():
+    assert canonical_key("https://www.example.com/lesson/1/?utm_medium=mail") == (
+        "https://example.com/lesson/1"
+    )
+
+
+def test_create_video_links_known_media(client):
+    first = client.post("/api/v1/videos", json={"url": "https://youtu.be/dQw4w9WgXcQ"})
+    again = client.post(
+        "/api/v1/videos", json={"url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10"}
+    )
+
+    assert first.status_code == 201
+    assert again.status_code == 200
+    assert again.json()["id"] == first.json()["id"]
+    assert len(client.get("/api/v1/videos").json()) == 1
@@ -0,0 +1,50 @@
+from app.models.platform_credential import PlatformCredential
+from app.services.credential_index import credential_index
+
+
+def add_credential(db, name: str, platform_url: str) -> PlatformCredential:
+    credential = PlatformCredential(
+        platform_name=name, platform_url=platform_url, auth_type="cookies"
+    )
+    db.add(credential)
+    db.commit()
+    return credential
+
+
+def matched(url: str) -> str | None:
+    credential = credential_index.lookup(url)
+    return credential.platform_name if credential else None
+
+
+def test_suffix_match_respects_label_boundaries(db):
+    add_credential(db, "cycle", "https://cycle.com.br")
+
+    assert matched("https://cycle.com.br/curso") == "cycle"
+    assert matched("https://app.cycle.com.br/aula/1") == "cycle"
+    assert matched("https://fullcycle.com.br/curso") is None
+
+
+def test_most_specific_suffix_wins(db):
+    add_credential(db, "generic", "com.br")
+    add_credential(db, "fullcycle", "www.fullcycle.com.br")
+
+    assert matched("https://plataforma.fullcycle.com.br/x") == "fullcycle"
+    assert matched("https://other.com.br/x") == "generic"
+
+
+def test_bare_label_matches_any_host_with_that_label(db):
+    add_credential(db, "youtube", "youtube")
+
+    assert matched("https://m.youtube.com/watch?v=x") == "youtube"
+    assert matched("https://notyoutube.com/watch?v=x") is None
+
+
+def test_index_reloads_after_commit(db):
+    assert matched("https://vimeo.com/1") is None
+
+    credential = add_credential(db, "vimeo", "vimeo.com")
+    assert matched("https://vimeo.com/1") == "vimeo"
+
+    db.delete(credential)
+    db.commit()
+    assert matched("https://vimeo.com/1") is None
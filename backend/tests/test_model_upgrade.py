@@ -0,0 +1,76 @@
+import pytest
+
+from app.config import settings
+from app.models.job import Job
+from app.models.transcription import Transcription
+from app.models.video import Video
+from app.services import model_policy
+from app.tasks import pipeline, queue
+
+
+@pytest.fixture
+def fast_transcript(db, monkeypatch):
+    monkeypatch.setattr(settings, "model_policy", "adaptive")
+    monkeypatch.setattr(settings, "model_fast", "tiny")
+    monkeypatch.setattr(settings, "whisper_model", "base")
+    monkeypatch.setattr(settings, "transcription_cache", False)
+    db.add(
+        Video(
+            id="v",
+            url="https://example.com/v",
+            title="Aula",
+            status="completed",
+            audio_path="videos/v/audio.wav",
+            transcription_path="videos/v/transcription.md",
+        )
+    )
+    db.add(Transcription(video_id="v", engine="whisper_local", model_name="tiny", raw_text="x"))
+    db.commit()
+
+
+def run_upgrade():
+    queue._enqueue_upgrade()
+    claimed = queue._claim_next("transcribe")
+    assert claimed is not None and claimed[-1] == model_policy.UPGRADE_PRIORITY
+    queue._run_job("transcribe", *claimed)
+
+
+def test_failed_upgrade_keeps_video_completed(db, fast_transcript, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("out of memory")
+
+    monkeypatch.setattr(pipeline, "transcribe_audio", fail)
+
+    run_upgrade()
+
+    db.expire_all()
+    video = db.get(Video, "v")
+    job = db.query(Job).filter(Job.video_id == "v").one()
+    assert (video.status, video.error_message) == ("completed", None)
+    assert job.status == "failed" and "out of memory" in job.error_message
+    assert [t.model_name for t in video.transcriptions] == ["tiny"]
+    # Not picked again on the next idle check.
+    assert model_policy.upgrade_candidate(db) is None
+
+
+def test_successful_upgrade_adds_whisper_model_transcript(db, fast_transcript, monkeypatch):
+    def transcribe(audio_path, engine, model_name, **kwargs):
+        return {
+            "engine": engine,
+            "model_name": model_name,
+            "language": "pt",
+            "raw_text": "texto melhor",
+            "segments": [{"start": 0.0, "end": 1.0, "text": "texto melhor"}],
+            "duration_seconds": 1,
+            "real_time_factor": 0.5,
+        }
+
+    monkeypatch.setattr(pipeline, "transcribe_audio", transcribe)
+
+    run_upgrade()
+
+    db.expire_all()
+    video = db.get(Video, "v")
+    assert video.status == "completed"
+    assert sorted(t.model_name for t in video.transcriptions) == ["base", "tiny"]
+    assert model_policy.upgrade_candidate(db) is None
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.video import Video
+
+
+def add_videos(db, count: int) -> list[str]:
+    """Videos newest first; two share each timestamp so the id breaks ties."""
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    videos = [
+        Video(
+            id=f"v{i:02d}",
+            url=f"https://example.com/{i}",
+            created_at=base + timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ]
+    db.add_all(videos)
+    db.commit()
+    return [v.id for v in sorted(videos, key=lambda v: (v.created_at, v.id), reverse=True)]
+
+
+def test_cursor_walks_every_video_once_newest_first(client, db):
+    expected = add_videos(db, 7)
+
+    seen, cursor = [], None
+    while True:
+        params = {"per_page": 3, **({"after": cursor} if cursor else {})}
+        response = client.get("/api/v1/videos", params=params)
+        assert response.status_code == 200
+        seen += [v["id"] for v in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen == expected
+
+
+def test_cursor_is_stable_when_newer_videos_arrive(client, db):
+    expected = add_videos(db, 4)
+    first = client.get("/api/v1/videos", params={"per_page": 2})
+    db.add(Video(id="newest", url="https://example.com/newest"))
+    db.commit()
+
+    rest = client.get(
+        "/api/v1/videos", params={"per_page": 2, "after": first.headers["X-Next-Cursor"]}
+    )
+
+    assert [v["id"] for v in rest.json()] == expected[2:]
+
+
+def test_page_shorter_than_limit_has_no_cursor(client, db):
+    add_videos(db, 2)
+
+    response = client.get("/api/v1/videos", params={"per_page": 5})
+
+    assert len(response.json()) == 2
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get("/api/v1/videos", params={"after": "not-a-cursor"})
+
+    assert response.status_code == 400
@@ -0,0 +1,61 @@
+import pytest
+
+from app.models.job import Job
+from app.models.video import Video
+from app.tasks import queue
+
+
+@pytest.mark.parametrize(
+    "status, media, stage, resumed_status",
+    [
+        ("downloading", {}, "download", "pending"),
+        ("extracting", {"video_path": "videos/v/video.mp4"}, "extract", "downloaded"),
+        ("transcribing", {"audio_path": "videos/v/audio.wav"}, "transcribe", "extracted"),
+        # Subtitle fast path: "transcribing" straight from the download job, no media.
+        ("transcribing", {}, "download", "pending"),
+    ],
+)
+def test_recover_jobs_requeues_interrupted_job(db, status, media, stage, resumed_status):
+    db.add(Video(id="v", url="https://example.com/v", status=status, **media))
+    db.add(Job(video_id="v", stage=stage, status="running", engine="faster_whisper", priority=-10))
+    db.commit()
+
+    queue.recover_jobs()
+
+    db.expire_all()
+    video = db.get(Video, "v")
+    jobs = db.query(Job).filter(Job.video_id == "v").all()
+    assert video.status == resumed_status
+    assert [(j.stage, j.status) for j in jobs] == [
+        (queue.stage_for_status(resumed_status), "queued")
+    ]
+    # The interrupted job keeps what it was asked to do.
+    assert jobs[0].engine == "faster_whisper"
+    assert jobs[0].priority == -10
+
+
+def test_recover_jobs_enqueues_stuck_video_without_job(db):
+    db.add(
+        Video(
+            id="v",
+            url="https://example.com/v",
+            status="extracting",
+            video_path="videos/v/video.mp4",
+        )
+    )
+    db.commit()
+
+    queue.recover_jobs()
+
+    jobs = db.query(Job).filter(Job.video_id == "v").all()
+    assert [(j.stage, j.status) for j in jobs] == [("extract", "queued")]
+    assert db.get(Video, "v").status == "downloaded"
+
+
+def test_enqueue_skips_video_with_running_job(db):
+    db.add(Video(id="v", url="https://example.com/v", status="pending"))
+    db.add(Job(video_id="v", stage="download", status="running"))
+    db.commit()
+
+    assert queue.enqueue(db, "v") is None
+    assert db.query(Job).filter(Job.video_id == "v").count() == 1
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.transcription import Transcription, TranscriptSegment
+from app.models.video import Video
+from app.services import search_index
+
+
+def add_video(db, video_id: str, title: str, description: str = ""):
+    db.add(
+        Video(
+            id=video_id,
+            url=f"https://example.com/{video_id}",
+            title=title,
+            description=description,
+            status="completed",
+        )
+    )
+    db.flush()
+    search_index.index_video(db, video_id)
+    db.commit()
+
+
+def add_transcription(
+    db, video_id: str, segments: list[tuple[float, str]], age_days: int = 0
+):
+    transcription = Transcription(
+        video_id=video_id,
+        engine="whisper_local",
+        model_name="base",
+        raw_text=" ".join(text for _, text in segments),
+        created_at=datetime.now(timezone.utc) - timedelta(days=age_days),
+    )
+    db.add(transcription)
+    db.flush()
+    db.add_all(
+        TranscriptSegment(
+            transcription_id=transcription.id,
+            position=i,
+            start_seconds=start,
+            end_seconds=start + 5,
+            text=text,
+        )
+        for i, (start, text) in enumerate(segments)
+    )
+    search_index.index_video(db, video_id)
+    db.commit()
+    return transcription
+
+
+def listed(client, search: str) -> list[str]:
+    response = client.get("/api/v1/videos", params={"search": search})
+    assert response.status_code == 200
+    return sorted(v["id"] for v in response.json())
+
+
+def test_match_expression_quotes_terms_and_prefixes_the_last():
+    assert search_index.match_expression('intro "python" asy') == '"intro" "python" "asy"*'
+    assert search_index.match_expression('" "') == ""
+
+
+def test_list_filters_by_full_text_search(client, db):
+    add_video(db, "a", "Introdução ao Python", "Aula sobre asyncio")
+    add_video(db, "b", "Docker na prática")
+
+    assert listed(client, "introducao") == ["a"]  # diacritics folded
+    assert listed(client, "pyth") == ["a"]  # last term is a prefix
+    assert listed(client, "python asyncio") == ["a"]  # every term must match
+    assert listed(client, "python docker") == []
+
+
+def test_list_search_without_fts_terms_does_not_drop_the_filter(client, db):
+    add_video(db, "a", 'Say "hi"')
+    add_video(db, "b", "Plain title")
+
+    assert listed(client, '"') == ["a"]
+    assert listed(client, "!!!") == []
+
+
+def test_search_hits_start_at_first_matching_segment_of_latest_transcript(client, db):
+    add_video(db, "a", "Aula 1")
+    add_video(db, "b", "Aula 2")
+    add_video(db, "c", "Sem transcrição de interesse")
+    # The older transcript mentions the term earlier; only the latest counts.
+    add_transcription(db, "a", [(0.0, "kubernetes no começo")], age_days=1)
+    add_transcription(
+        db, "a", [(0.0, "abertura"), (12.5, "agora Kubernetes"), (30.0, "kubernetes")]
+    )
+    add_transcription(db, "b", [(3.0, "falando de kubernetes")])
+
+    response = client.get("/api/v1/videos/search", params={"q": "kubernetes"})
+
+    assert response.status_code == 200
+    starts = {hit["video"]["id"]: hit["start_seconds"] for hit in response.json()}
+    assert starts == {"a": 12.5, "b": 3.0}
+
+
+def test_search_hit_without_matching_segment_has_no_start(client, db):
+    add_video(db, "a", "Kubernetes do zero")
+    add_transcription(db, "a", [(0.0, "introdução")])
+
+    hits = client.get("/api/v1/videos/search", params={"q": "kubernetes"}).json()
+
+    assert [(hit["video"]["id"], hit["start_seconds"]) for hit in hits] == [("a", None)]
+
+
+def test_segments_are_paged_by_offset_and_time_window(client, db):
+    add_video(db, "a", "Aula")
+    add_transcription(db, "a", [(i * 10.0, f"parte {i}") for i in range(5)])
+    url = "/api/v1/videos/a/transcription/segments"
+
+    first = client.get(url, params={"limit": 2}).json()
+    last = client.get(url, params={"limit": 2, "offset": 4}).json()
+    window = client.get(url, params={"start": 12, "end": 31}).json()
+
+    assert [s["position"] for s in first["segments"]] == [0, 1]
+    assert first["next_offset"] == 2
+    assert [s["position"] for s in last["segments"]] == [4]
+    assert last["next_offset"] is None
+    assert [s["position"] for s in window["segments"]] == [1, 2, 3]
@@ -0,0 +1,73 @@
+import wave
+
+import numpy as np
+import pytest
+
+from app.services.vad import group_regions, remap_segments, speech_regions
+
+RATE = 16000
+
+
+def tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * RATE)) / RATE
+    return 0.5 * np.sin(2 * np.pi * 220 * t) * (1 + 0.5 * np.sin(2 * np.pi * 3 * t))
+
+
+def write_wav(path, samples: np.ndarray) -> str:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes((samples * 32767).astype(np.int16).tobytes())
+    return str(path)
+
+
+def test_speech_regions_skip_silence():
+    samples = np.concatenate([np.zeros(3 * RATE), tone(2), np.zeros(3 * RATE)])
+
+    regions = speech_regions(samples.astype(np.float32), RATE)
+
+    assert len(regions) == 1
+    start, end = regions[0]
+    assert 2.5 * RATE <= start <= 3 * RATE
+    assert 5 * RATE <= end <= 5.5 * RATE
+
+
+def test_group_regions_packs_up_to_max_samples(tmp_path):
+    audio = write_wav(tmp_path / "a.wav", np.zeros(60 * RATE))
+    regions = [(0, 4 * RATE), (10 * RATE, 14 * RATE), (20 * RATE, 24 * RATE)]
+
+    groups = group_regions(regions, 9 * RATE, audio)
+
+    assert groups == [regions[:2], regions[2:]]
+
+
+def test_group_regions_splits_long_regions_at_a_pause(tmp_path):
+    samples = tone(50)
+    pause = slice(int(17 * RATE), int(17.5 * RATE))
+    samples[pause] = 0
+    audio = write_wav(tmp_path / "a.wav", samples)
+
+    groups = group_regions([(0, 50 * RATE)], 20 * RATE, audio)
+
+    pieces = [piece for group in groups for piece in group]
+    assert all(end - start <= 20 * RATE for start, end in pieces)
+    assert pieces[0][0] == 0 and pieces[-1][1] == 50 * RATE
+    assert all(a[1] == b[0] for a, b in zip(pieces, pieces[1:]))
+    assert pause.start <= pieces[0][1] <= pause.stop
+
+
+def test_remap_segments_restores_original_timeline():
+    # 2 s of speech at 10 s and 3 s at 30 s, transcribed back to back.
+    regions = [(10 * RATE, 12 * RATE), (30 * RATE, 33 * RATE)]
+    segments = [
+        {"start": 0.5, "end": 2.0, "text": "a"},
+        {"start": 2.0, "end": 4.5, "text": "b"},
+    ]
+
+    remapped = remap_segments(segments, regions, RATE)
+
+    assert [(s["start"], s["end"], s["text"]) for s in remapped] == [
+        (pytest.approx(10.5), pytest.approx(12.0), "a"),
+        (pytest.approx(30.0), pytest.approx(32.5), "b"),
+    ]
@@ -9,6 +9,9 @@ export default function SettingsPage() {
   const [engine, setEngine] = useState("");
   const [model, setModel] = useState("");
   const [apiKey, setApiKey] = useState("");
+  const [subtitlesPolicy, setSubtitlesPolicy] = useState("off");
+  const [modelPolicy, setModelPolicy] = useState("fixed");
+  const [modelFast, setModelFast] = useState("tiny");
   const [saving, setSaving] = useState(false);
   const [message, setMessage] = useState("");
 
@@ -28,6 +31,9 @@ export default function SettingsPage() {
       setSettings(s);
       setEngine(s.whisper_engine);
       setModel(s.whisper_model);
+      setSubtitlesPolicy(s.subtitles_policy);
+      setModelPolicy(s.model_policy);
+      setModelFast(s.model_fast);
     });
     loadCredentials();
   }, []);
@@ -41,7 +47,13 @@ export default function SettingsPage() {
     setSaving(true);
     setMessage("");
     try {
-      const data: any = { whisper_engine: engine, whisper_model: model };
+      const data: any = {
+        whisper_engine: engine,
+        whisper_model: model,
+        subtitles_policy: subtitlesPolicy,
+        model_policy: modelPolicy,
+        model_fast: modelFast,
+      };
       if (apiKey) data.openai_api_key = apiKey;
       const updated = await api.updateSettings(data) as Settings;
       setSettings(updated);
@@ -121,6 +133,7 @@ export default function SettingsPage() {
             className="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 outline-none"
           >
             <option value="whisper_local">Whisper Local</option>
+            <option value="faster_whisper">Faster Whisper (CPU int8)</option>
             <option value="openai_api">OpenAI API</option>
           </select>
         </div>
@@ -129,7 +142,7 @@ export default function SettingsPage() {
           <label className="block text-sm font-medium text-gray-700 mb-1">
             Modelo
           </label>
-          {engine === "whisper_local" ? (
+          {engine === "whisper_local" || engine === "faster_whisper" ? (
             <select
               value={model}
               onChange={(e) => setModel(e.target.value)}
@@ -150,6 +163,38 @@ export default function SettingsPage() {
           )}
         </div>
 
+        {(engine === "whisper_local" || engine === "faster_whisper") && (
+          <div>
+            <label className="block text-sm font-medium text-gray-700 mb-1">
+              Seleção de modelo
+            </label>
+            <select
+              value={modelPolicy}
+              onChange={(e) => setModelPolicy(e.target.value)}
+              className="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 outline-none"
+            >
+              <option value="fixed">Sempre usar o modelo acima</option>
+              <option value="adaptive">Adaptativa (modelo rápido com fila cheia ou vídeos longos)</option>
+            </select>
+            {modelPolicy === "adaptive" && (
+              <>
+                <select
+                  value={modelFast}
+                  onChange={(e) => setModelFast(e.target.value)}
+                  className="w-full mt-2 px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 outline-none"
+                >
+                  {localModels.map((m) => (
+                    <option key={m} value={m}>{m}</option>
+                  ))}
+                </select>
+                <p className="text-xs text-gray-500 mt-1">
+                  Transcrições feitas com o modelo rápido são refeitas com o modelo acima quando a fila fica ociosa.
+                </p>
+              </>
+            )}
+          </div>
+        )}
+
         {engine === "openai_api" && (
           <div>
             <label className="block text-sm font-medium text-gray-700 mb-1">
@@ -165,6 +210,24 @@ export default function SettingsPage() {
           </div>
         )}
 
+        <div>
+          <label className="block text-sm font-medium text-gray-700 mb-1">
+            Legendas da plataforma
+          </label>
+          <select
+            value={subtitlesPolicy}
+            onChange={(e) => setSubtitlesPolicy(e.target.value)}
+            className="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 outline-none"
+          >
+            <option value="off">Sempre transcrever com Whisper</option>
+            <option value="manual">Usar legendas manuais quando houver</option>
+            <option value="any">Usar legendas manuais ou automáticas</option>
+          </select>
+          <p className="text-xs text-gray-500 mt-1">
+            Vídeos com legendas aproveitáveis não são baixados nem transcritos; use Re-transcrever para rodar o Whisper.
+          </p>
+        </div>
+
         <div className="flex items-center gap-3">
           <button
             type="submit"
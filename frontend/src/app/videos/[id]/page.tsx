@@ -4,16 +4,37 @@ import { useEffect, useState, useCallback } from "react";
 import { useParams, useRouter } from "next/navigation";
 import { Trash2, RotateCcw, RefreshCw } from "lucide-react";
 import { api } from "@/lib/api";
-import type { Video } from "@/lib/types";
+import type { PipelineProgress, Video } from "@/lib/types";
 import StatusBadge from "@/components/StatusBadge";
 import TranscriptionViewer from "@/components/TranscriptionViewer";
-import { usePolling } from "@/hooks/usePolling";
+import { useEventStream } from "@/hooks/useEventStream";
+
+function describeProgress(p: PipelineProgress): string {
+  if (p.stage === "download" && p.downloaded_bytes != null) {
+    const mb = (n: number) => (n / 1024 / 1024).toFixed(1);
+    const total = p.total_bytes ? ` / ${mb(p.total_bytes)} MB` : " MB";
+    const speed = p.speed ? ` (${mb(p.speed)} MB/s)` : "";
+    return `${mb(p.downloaded_bytes)}${total}${speed}`;
+  }
+  if (p.chunks_total) return `${p.chunks_done}/${p.chunks_total} partes, ${p.segments} segmentos`;
+  if (p.position_seconds != null) {
+    const pos = `${Math.floor(p.position_seconds / 60)}m ${Math.floor(p.position_seconds % 60)}s`;
+    const pct = p.duration_seconds
+      ? ` (${Math.min(100, Math.round((p.position_seconds / p.duration_seconds) * 100))}%)`
+      : "";
+    const segs = p.segments != null ? `, ${p.segments} segmentos` : "";
+    return `${pos}${pct}${segs}`;
+  }
+  if (p.segments != null) return `${p.segments} segmentos`;
+  return "";
+}
 
 export default function VideoDetailPage() {
   const { id } = useParams<{ id: string }>();
   const router = useRouter();
   const [video, setVideo] = useState<Video | null>(null);
   const [error, setError] = useState("");
+  const [progress, setProgress] = useState<PipelineProgress | null>(null);
 
   const loadVideo = useCallback(() => {
     api.getVideo(id).then(setVideo).catch((e) => setError(e.message));
@@ -27,7 +48,16 @@ export default function VideoDetailPage() {
     ? ["pending", "downloading", "extracting", "transcribing"].includes(video.status)
     : false;
 
-  usePolling(loadVideo, 3000, isProcessing);
+  const handleStatus = useCallback(() => {
+    setProgress(null);
+    loadVideo();
+  }, [loadVideo]);
+
+  useEventStream(
+    api.eventsUrl(id),
+    { status: handleStatus, progress: setProgress },
+    isProcessing
+  );
 
   async function handleDelete() {
     if (!confirm("Tem certeza que deseja deletar este vídeo?")) return;
@@ -60,6 +90,9 @@ export default function VideoDetailPage() {
           )}
         </div>
         <div className="flex items-center gap-2">
+          {isProcessing && progress && (
+            <span className="text-xs text-gray-500">{describeProgress(progress)}</span>
+          )}
           <StatusBadge status={video.status} />
           {video.status === "failed" && (
             <button
@@ -1,11 +1,15 @@
 "use client";
 
-import { useEffect, useState, useCallback } from "react";
+import { useEffect, useState, useCallback, useRef } from "react";
 import { api } from "@/lib/api";
 import type { Video } from "@/lib/types";
 import VideoCard from "@/components/VideoCard";
 import AddVideoForm from "@/components/AddVideoForm";
-import { usePolling } from "@/hooks/usePolling";
+import { useEventStream } from "@/hooks/useEventStream";
+
+// Status events patch their row at once; the list is refetched at most this
+// often for titles, thumbnails and rows added by imports.
+const RELOAD_INTERVAL_MS = 2000;
 
 export default function VideosPage() {
   const [videos, setVideos] = useState<Video[]>([]);
@@ -23,7 +27,29 @@ export default function VideosPage() {
     ["pending", "downloading", "extracting", "transcribing"].includes(v.status)
   );
 
-  usePolling(loadVideos, 3000, hasProcessing);
+  const reloadTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+  useEffect(() => {
+    return () => {
+      if (reloadTimer.current) clearTimeout(reloadTimer.current);
+    };
+  }, []);
+
+  const handleStatus = useCallback(
+    (data: { video_id: string; status: string }) => {
+      setVideos((current) =>
+        current.map((v) => (v.id === data.video_id ? { ...v, status: data.status } : v))
+      );
+      if (reloadTimer.current) return;
+      reloadTimer.current = setTimeout(() => {
+        reloadTimer.current = null;
+        loadVideos();
+      }, RELOAD_INTERVAL_MS);
+    },
+    [loadVideos]
+  );
+
+  useEventStream(api.eventsUrl(), { status: handleStatus }, hasProcessing);
 
   return (
     <div>
@@ -0,0 +1,31 @@
+"use client";
+
+import { useEffect, useRef } from "react";
+
+export type EventHandlers = Record<string, (data: any) => void>;
+
+export function useEventStream(url: string, handlers: EventHandlers, enabled: boolean) {
+  const savedHandlers = useRef(handlers);
+
+  useEffect(() => {
+    savedHandlers.current = handlers;
+  }, [handlers]);
+
+  useEffect(() => {
+    if (!enabled) return;
+
+    // EventSource reconnects on its own if the connection drops.
+    const source = new EventSource(url);
+    const types = Object.keys(savedHandlers.current);
+    const listeners = types.map((type) => {
+      const listener = (e: MessageEvent) =>
+        savedHandlers.current[type]?.(JSON.parse(e.data));
+      source.addEventListener(type, listener);
+      return listener;
+    });
+    return () => {
+      types.forEach((type, i) => source.removeEventListener(type, listeners[i]));
+      source.close();
+    };
+  }, [url, enabled]);
+}
@@ -1,18 +0,0 @@
-"use client";
-
-import { useEffect, useRef } from "react";
-
-export function usePolling(callback: () => void, intervalMs: number, enabled: boolean) {
-  const savedCallback = useRef(callback);
-
-  useEffect(() => {
-    savedCallback.current = callback;
-  }, [callback]);
-
-  useEffect(() => {
-    if (!enabled) return;
-
-    const id = setInterval(() => savedCallback.current(), intervalMs);
-    return () => clearInterval(id);
-  }, [intervalMs, enabled]);
-}
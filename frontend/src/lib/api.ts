@@ -119,4 +119,8 @@ export const api = {
   }) => request("/settings", { method: "PUT", body: JSON.stringify(data) }),
   getStats: () => request<import("./types").Stats>("/stats"),
   health: () => request<{ status: string }>("/health"),
+
+  // Server-Sent Events
+  eventsUrl: (videoId?: string) =>
+    videoId ? `${API_URL}/videos/${videoId}/events` : `${API_URL}/events`,
 };
@@ -15,6 +15,20 @@ export interface Video {
   updated_at: string;
 }
 
+export interface PipelineProgress {
+  video_id: string;
+  stage: "download" | "extract" | "transcribe";
+  downloaded_bytes?: number | null;
+  total_bytes?: number | null;
+  speed?: number | null;
+  eta?: number | null;
+  position_seconds?: number;
+  duration_seconds?: number | null;
+  chunks_done?: number;
+  chunks_total?: number;
+  segments?: number;
+}
+
 export interface Playlist {
   id: string;
   name: string;
@@ -37,6 +51,7 @@ export interface Transcription {
   raw_text: string | null;
   markdown_path: string | null;
   duration_seconds: number | null;
+  real_time_factor: number | null;
   created_at: string;
 }
 
@@ -66,4 +81,7 @@ export interface Settings {
   whisper_engine: string;
   whisper_model: string;
   openai_api_key_set: boolean;
+  subtitles_policy: "off" | "manual" | "any";
+  model_policy: "fixed" | "adaptive";
+  model_fast: string;
 }